@@ -99,7 +99,7 @@ class IntrinsicReactionCoordinate(OptimizationInterface):
                 self.molsys,
                 dq,
                 fq,
-                **self.params.__dict__,
+                **self.params.to_dict(),
                 return_str=True,
                 ensure_convergence=True
             )
@@ -145,7 +145,7 @@ class IntrinsicReactionCoordinate(OptimizationInterface):
             "fq": fq_new,
         }
 
-        substep_convergence = convcheck.conv_check(conv_data, self.params.__dict__, self.requires(), str_mode=str_mode)
+        substep_convergence = convcheck.conv_check(conv_data, self.params.to_dict(), self.requires(), str_mode=str_mode)
         if not str_mode:
             logger.info("\tConvergence check returned %s for constrained optimization." % substep_convergence)
 
@@ -188,7 +188,7 @@ class IntrinsicReactionCoordinate(OptimizationInterface):
             self.molsys,
             dq_pivot,
             fq,
-            **self.params.__dict__,
+            **self.params.to_dict(),
             ensure_convergence=True,
             return_str=True
         )
@@ -1,6 +1,5 @@
 import json
 import logging
-from copy import deepcopy
 
 import numpy as np
 from qcelemental.models import AtomicInput, AtomicResult, Molecule
@@ -51,7 +50,7 @@ class ComputeWrapper:
         json_for_input : dict
         """
 
-        self.molecule["geometry"] = [i for i in geom.flat]
+        self.molecule["geometry"] = geom.ravel().tolist()
 
     def generate_schema_input(self, driver):
 
@@ -92,7 +91,8 @@ class ComputeWrapper:
         ret = json.loads(json_dumps(ret))
         self.trajectory.append(ret)
 
-        if print_result:
+        # Only pay for re-serializing the result when it will actually be logged
+        if print_result and logger.isEnabledFor(logging.DEBUG):
             logger.debug(json.dumps(ret, indent=2))
 
         if ret["success"]:
@@ -213,7 +213,8 @@ class UserComputer(ComputeWrapper):
             if E is None:
                 raise OptError("Must provide energy.")
 
-        result = deepcopy(UserComputer.output_skeleton)
+        # Only "properties" and "extras" are filled in below; the other entries can be shared
+        result = dict(UserComputer.output_skeleton, properties={}, extras={"qcvars": {}})
         result["driver"] = driver
         mol = Molecule(**self.molecule)
         result["molecule"] = mol
@@ -4,7 +4,7 @@ from itertools import combinations
 import numpy as np
 import qcelemental as qcel
 
-from . import addIntcos, bend, oofp, stre, tors
+from . import addIntcos, bend, intcosMisc, oofp, stre, tors
 from .exceptions import OptError
 from .printTools import print_array_string, print_mat_string
 from .v3d import are_collinear
@@ -182,10 +182,7 @@ class Frag:
         return frag_atom_symbol_list
 
     def Bmat(self):
-        B = np.zeros((self.num_intcos, 3 * self.natom))
-        for i, intco in enumerate(self._intcos):
-            intco.DqDx(self.geom, B[i])
-        return B
+        return intcosMisc.Bmat(self._intcos, self.geom)
 
     def fix_bend_axes(self):
         for intco in self._intcos:
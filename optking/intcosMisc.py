@@ -26,8 +26,14 @@ def Bmat(intcos, geom, masses=None):
     Nint = len(intcos)
     B = np.zeros((Nint, 3 * len(geom)))
 
+    # torsions are done together, in a single vectorized pass
+    tors_rows = [i for i, intco in enumerate(intcos) if isinstance(intco, tors.Tors)]
+    if tors_rows:
+        tors.TorsionBatch([intcos[i] for i in tors_rows]).DqDx(geom, B, tors_rows)
+
     for i, intco in enumerate(intcos):
-        intco.DqDx(geom, B[i])
+        if not isinstance(intco, tors.Tors):
+            intco.DqDx(geom, B[i])
 
     if type(masses) is np.ndarray:
         sqrtm = np.array([np.repeat(np.sqrt(masses), 3)] * Nint, float)
@@ -118,7 +118,7 @@ class Molsys(object):
     def to_schema(self):
         mol_dict = {
             "symbols": self.atom_symbols,
-            "geometry": self.geom.flat,
+            "geometry": self.geom.flatten(),
             "atomic_numbers": self.Z,
             "mass_numbers": self.masses,
             "fix_com": True,
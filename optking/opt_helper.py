@@ -91,7 +91,7 @@ class Helper(ABC):
 
         if status == "CONVERGED" and len(energies) > 0:
             if self.params.opt_type != "IRC":
-                conv_table, criteria_table = conv_check(conv_info, self.params.__dict__, str_mode="both")
+                conv_table, criteria_table = conv_check(conv_info, self.params.to_dict(), str_mode="both")
                 string += conv_table
                 string += criteria_table
                 string += self.history.summary_string()
@@ -104,7 +104,7 @@ class Helper(ABC):
                 conv_info["iternum"] = irc_object.irc_step_number
                 conv_info["fq"] = irc_object.irc_history._project_forces(self.fq, self.molsys)
 
-            string += conv_check(conv_info, self.params.__dict__, str_mode="table")
+            string += conv_check(conv_info, self.params.to_dict(), str_mode="table")
 
         string += "Next Geometry in Ang \n"
         string += self.molsys.show_geom()
@@ -113,7 +113,7 @@ class Helper(ABC):
     def to_dict(self):
         d = {
             "step_num": self.step_num,
-            "params": self.params.__dict__,
+            "params": self.params.to_dict(),
             "molsys": self.molsys.to_dict(),
             "history": self.history.to_dict(),
             "computer": self.computer.__dict__,
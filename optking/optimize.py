@@ -559,7 +559,7 @@ def get_pes_info(
         # For update. Compute new gradient. Update with external forces if present. Update the hessian
         logger.info(f"Updating Hessian with {str(params.hess_update)}")
         result = computer.compute(o_molsys.geom, driver=driver, return_full=False)
-        g_x = np.asarray(result) if driver == "gradient" else None
+        g_x = np.asarray(result, dtype=float) if driver == "gradient" else None
         f_q = o_molsys.gradient_to_internals(g_x, -1.0)
         f_q, H = o_molsys.apply_external_forces(f_q, H)
         H = opt_history.hessian_update(H, f_q, o_molsys)
@@ -572,12 +572,12 @@ def get_pes_info(
             logger.info(f"Guessing Hessian with {str(params.intrafrag_hess)}")
             H = hessian.guess(o_molsys, guessType=params.intrafrag_hess)
             result = computer.compute(o_molsys.geom, driver=driver, return_full=False)
-            g_x = np.asarray(result) if driver == "gradient" else None
+            g_x = np.asarray(result, dtype=float) if driver == "gradient" else None
         elif params.cart_hess_read:
             # read hessian from file. calculate gradient. Update params to not read from disk again
             logger.info("Reading hessian from file")
             result = computer.compute(o_molsys.geom, driver=driver, return_full=False)
-            g_x = np.asarray(result) if driver == "gradient" else None
+            g_x = np.asarray(result, dtype=float) if driver == "gradient" else None
             Hx = hessian.from_file(params.hessian_file)
             H = o_molsys.hessian_to_internals(Hx)
             params.cart_hess_read = False
@@ -611,14 +611,14 @@ def get_hess_grad(computer, o_molsys):
     Hessian is in internals gradient is in cartesian
     """
     ret = computer.compute(o_molsys.geom, driver="hessian", return_full=True, print_result=False)
-    h_cart = np.asarray(ret["return_result"]).reshape(o_molsys.geom.size, o_molsys.geom.size)
+    h_cart = np.asarray(ret["return_result"], dtype=float).reshape(o_molsys.geom.size, o_molsys.geom.size)
     try:
         logger.debug("Looking for gradient in hessian output")
-        g_cart = ret["extras"]["qcvars"]["CURRENT GRADIENT"]
+        g_cart = np.asarray(ret["extras"]["qcvars"]["CURRENT GRADIENT"], dtype=float)
     except KeyError:
         logger.error("Could not find the gradient in qcschema")
         grad = computer.compute(o_molsys.geom, driver="gradient", return_full=False)
-        g_cart = np.asarray(grad)
+        g_cart = np.asarray(grad, dtype=float)
     # Likely not at stationary point. Include forces
     # ADDENDUM currently neglects forces term for all points - including non-stationary
     H = o_molsys.hessian_to_internals(h_cart)
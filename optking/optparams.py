@@ -4,7 +4,10 @@
 # P = parameters ('self')
 # Option keys in the input dictionary are interpreted case-insensitively.
 # The enumerated string types are translated to all upper-case within the parameter object.
+import copy
+import functools
 import logging
+import sys
 
 from .exceptions import AlgError, OptError
 from .misc import int_float_list, int_fx_string, int_list, int_xyz_float_list, int_xyz_fx_string, tokenize_input_string
@@ -12,51 +15,358 @@ from . import log_name
 
 logger = logging.getLogger(f"{log_name}{__name__}")
 
-# Class for enumerated string options.
-def string_option(storage_name):
-    def string_option_getter(instance):
-        return instance.__dict__[storage_name]
+# The keys on the left here should be lower-case, and match the attribute names of OptParams.
+# The allowed values are upper-case; user values are upper-cased before the membership test.
+allowedStringOptions = {
+    "opt_type": frozenset({"MIN", "TS", "IRC"}),
+    "step_type": frozenset({"RFO", "RS_I_RFO", "P_RFO", "NR", "SD", "LINESEARCH", "CONJUGATE"}),
+    "opt_coordinates": frozenset(
+        {
+            "REDUNDANT",
+            "INTERNAL",
+            "DELOCALIZED",
+            "NATURAL",
+            "CARTESIAN",
+            "BOTH",
+        }
+    ),
+    "irc_direction": frozenset({"FORWARD", "BACKWARD"}),
+    "g_convergence": frozenset(
+        {
+            "QCHEM",
+            "MOLPRO",
+            "GAU",
+            "GAU_LOOSE",
+            "GAU_TIGHT",
+            "GAU_VERYTIGHT",
+            "TURBOMOLE",
+            "CFOUR",
+            "NWCHEM_LOOSE",
+            "INTERFRAG_TIGHT",
+        }
+    ),
+    "hess_update": frozenset({"NONE", "BFGS", "MS", "POWELL", "BOFILL"}),
+    "intrafrag_hess": frozenset({"SCHLEGEL", "FISCHER", "SIMPLE", "LINDH", "LINDH_SIMPLE"}),
+    "frag_mode": frozenset({"SINGLE", "MULTI"}),
+    "interfrag_mode": frozenset({"FIXED", "PRINCIPAL_AXES"}),
+    "interfrag_hess": frozenset({"DEFAULT", "FISCHER_LIKE"}),
+    "conjugate_gradient_type": frozenset({"FLETCHER", "DESCENT", "POLAK"}),
+}
 
-    def string_option_setter(instance, value):
-        if value.upper() in allowedStringOptions[storage_name]:
-            instance.__dict__[storage_name] = value.upper()
-        else:
-            raise OptError("Invalid value for " + storage_name)
+# _enum() upper-cases user values before the membership test, so every allowed value must be upper-case.
+for _key, _allowed in allowedStringOptions.items():
+    assert _key == _key.lower() and len(_allowed) >= 1, _key
+    assert all(_val == _val.upper() for _val in _allowed), _key
+del _key, _allowed
 
-    return property(string_option_getter, string_option_setter)
+# Shared value for absent frozen, ranged, and ext_force coordinate lists. Consumers only test
+# and iterate these, so one immutable empty tuple serves every OptParams instance.
+_EMPTY = ()
 
+# The OptParams attributes holding those (possibly nested) lists, parsed from hashable strings.
+_COORD_LIST_ATTRS = tuple(
+    f"{kind}_{coord}"
+    for kind in ("frozen", "ranged", "ext_force")
+    for coord in ("distance", "bend", "dihedral", "oofp", "cartesian")
+)
 
-# The keys on the left here should be lower-case, as should the storage name of the property.
-allowedStringOptions = {
-    "opt_type": ("MIN", "TS", "IRC"),
-    "step_type": ("RFO", "RS_I_RFO", "P_RFO", "NR", "SD", "LINESEARCH", "CONJUGATE"),
-    "opt_coordinates": (
-        "REDUNDANT",
-        "INTERNAL",
-        "DELOCALIZED",
-        "NATURAL",
-        "CARTESIAN",
-        "BOTH",
+# Default values of the user options, keyed by the upper-case option name.
+_DEFAULTS = {
+    "PROGRAM": "psi4",
+    "GEOM_MAXITER": 50,
+    "ALG_GEOM_MAXITER": 50,
+    "PRINT": 1,
+    "OUTPUT_TYPE": "FILE",
+    "OPT_TYPE": "MIN",
+    "STEP_TYPE": "RFO",
+    "STEEPEST_DESCENT_TYPE": "OVERLAP",
+    "CONJUGATE_GRADIENT_TYPE": "FLETCHER",
+    "OPT_COORDINATES": "REDUNDANT",
+    "RFO_FOLLOW_ROOT": False,
+    "RFO_ROOT": 0,
+    "ACCEPT_SYMMETRY_BREAKING": False,
+    "DYNAMIC_LEVEL": 0,
+    "DYNAMIC_LEVEL_MAX": 6,
+    "IRC_STEP_SIZE": 0.2,
+    "IRC_DIRECTION": "FORWARD",
+    "IRC_POINTS": 20,
+    "INTRAFRAG_STEP_LIMIT": 0.5,
+    "INTRAFRAG_STEP_LIMIT_MIN": 0.001,
+    "INTRAFRAG_STEP_LIMIT_MAX": 1.0,
+    "INTERFRAG_TRUST": 0.5,
+    "INTERFRAG_TRUST_MIN": 0.001,
+    "INTERFRAG_TRUST_MAX": 1.0,
+    "ENSURE_BT_CONVERGENCE": False,
+    "SIMPLE_STEP_SCALING": False,
+    "CONSECUTIVE_BACKSTEPS": 0,
+    "RFO_NORMALIZATION_MAX": 100,
+    "RSRFO_ALPHA_MAX": 1e8,
+    "TRAJECTORY": False,
+    "FROZEN_DISTANCE": "",
+    "FROZEN_BEND": "",
+    "FROZEN_DIHEDRAL": "",
+    "FROZEN_OOFP": "",
+    "FROZEN_CARTESIAN": "",
+    "RANGED_DISTANCE": "",
+    "RANGED_BEND": "",
+    "RANGED_DIHEDRAL": "",
+    "RANGED_OOFP": "",
+    "RANGED_CARTESIAN": "",
+    "EXT_FORCE_DISTANCE": "",
+    "EXT_FORCE_BEND": "",
+    "EXT_FORCE_DIHEDRAL": "",
+    "EXT_FORCE_OOFP": "",
+    "EXT_FORCE_CARTESIAN": "",
+    "G_CONVERGENCE": "QCHEM",
+    "MAX_FORCE_G_CONVERGENCE": 3.0e-4,
+    "RMS_FORCE_G_CONVERGENCE": 3.0e-4,
+    "MAX_ENERGY_G_CONVERGENCE": 1.0e-6,
+    "MAX_DISP_G_CONVERGENCE": 1.2e-3,
+    "RMS_DISP_G_CONVERGENCE": 1.2e-3,
+    "FLEXIBLE_G_CONVERGENCE": False,
+    "HESS_UPDATE": "BFGS",
+    "HESS_UPDATE_USE_LAST": 4,
+    "HESS_UPDATE_LIMIT": True,
+    "HESS_UPDATE_LIMIT_MAX": 1.00,
+    "HESS_UPDATE_LIMIT_SCALE": 0.50,
+    "HESS_UPDATE_DEN_TOL": 1e-7,
+    "CART_HESS_READ": False,
+    "HESSIAN_FILE": None,
+    "FULL_HESS_EVERY": -1,
+    "INTRAFRAG_HESS": "SCHLEGEL",
+    "BT_MAX_ITER": 25,
+    "BT_DX_CONV": 1.0e-7,
+    "BT_DX_RMS_CHANGE_CONV": 1.0e-12,
+    "BT_PINV_RCOND": 1.0e-6,
+    "FRAG_MODE": "SINGLE",
+    "FRAG_REF_ATOMS": None,
+    "FREEZE_INTRAFRAG": False,
+    "INTERFRAG_MODE": "FIXED",
+    "ADD_AUXILIARY_BONDS": False,
+    "AUXILIARY_BOND_FACTOR": 2.5,
+    "INTERFRAG_DIST_INV": False,
+    "INTERFRAG_COLLINEAR_TOL": 0.01,
+    "INTERFRAG_COORDS": None,
+    "COVALENT_CONNECT": 1.3,
+    "INTERFRAGMENT_CONNECT": 1.8,
+    "H_BOND_CONNECT": 4.3,
+    "GENERATE_INTCOS_EXIT": False,
+    "INCLUDE_OOFP": False,
+    "TEST_B": False,
+    "TEST_DERIVATIVE_B": False,
+    "KEEP_INTCOS": False,
+    "LINESEARCH_STEP": 0.100,
+    "LINESEARCH": False,
+    "SD_HESSIAN": 1.0,
+}
+
+# Convergence criteria which are active (i_*) and their thresholds (conv_*) before any
+# user-specified MAX_*_G_CONVERGENCE or RMS_*_G_CONVERGENCE is applied.
+_DEFAULT_CONV = {
+    "i_max_force": False,
+    "i_rms_force": False,
+    "i_max_DE": False,
+    "i_max_disp": False,
+    "i_rms_disp": False,
+    "i_untampered": False,
+    "conv_rms_force": -1,
+    "conv_rms_disp": -1,
+    "conv_max_DE": -1,
+    "conv_max_force": -1,
+    "conv_max_disp": -1,
+}
+
+# User options which each override one of the convergence criteria.
+_CONV_USER_KEYS = frozenset(
+    {
+        "MAX_FORCE_G_CONVERGENCE",
+        "RMS_FORCE_G_CONVERGENCE",
+        "MAX_ENERGY_G_CONVERGENCE",
+        "MAX_DISP_G_CONVERGENCE",
+        "RMS_DISP_G_CONVERGENCE",
+    }
+)
+
+# Preset criteria for each value of g_convergence. Only the active criteria are listed.
+_G_CONV_TABLE = {
+    "QCHEM": {
+        "i_untampered": True,
+        "conv_max_force": 3.0e-4,
+        "i_max_force": True,
+        "conv_max_DE": 1.0e-6,
+        "i_max_DE": True,
+        "conv_max_disp": 1.2e-3,
+        "i_max_disp": True,
+    },
+    "MOLPRO": {
+        "i_untampered": True,
+        "conv_max_force": 3.0e-4,
+        "i_max_force": True,
+        "conv_max_DE": 1.0e-6,
+        "i_max_DE": True,
+        "conv_max_disp": 3.0e-4,
+        "i_max_disp": True,
+    },
+    "GAU": {
+        "i_untampered": True,
+        "conv_max_force": 4.5e-4,
+        "i_max_force": True,
+        "conv_rms_force": 3.0e-4,
+        "i_rms_force": True,
+        "conv_max_disp": 1.8e-3,
+        "i_max_disp": True,
+        "conv_rms_disp": 1.2e-3,
+        "i_rms_disp": True,
+    },
+    "GAU_TIGHT": {
+        "i_untampered": True,
+        "conv_max_force": 1.5e-5,
+        "i_max_force": True,
+        "conv_rms_force": 1.0e-5,
+        "i_rms_force": True,
+        "conv_max_disp": 6.0e-5,
+        "i_max_disp": True,
+        "conv_rms_disp": 4.0e-5,
+        "i_rms_disp": True,
+    },
+    "GAU_VERYTIGHT": {
+        "i_untampered": True,
+        "conv_max_force": 2.0e-6,
+        "i_max_force": True,
+        "conv_rms_force": 1.0e-6,
+        "i_rms_force": True,
+        "conv_max_disp": 6.0e-6,
+        "i_max_disp": True,
+        "conv_rms_disp": 4.0e-6,
+        "i_rms_disp": True,
+    },
+    "GAU_LOOSE": {
+        "i_untampered": True,
+        "conv_max_force": 2.5e-3,
+        "i_max_force": True,
+        "conv_rms_force": 1.7e-3,
+        "i_rms_force": True,
+        "conv_max_disp": 1.0e-2,
+        "i_max_disp": True,
+        "conv_rms_disp": 6.7e-3,
+        "i_rms_disp": True,
+    },
+    "TURBOMOLE": {
+        "i_untampered": True,
+        "conv_max_force": 1.0e-3,
+        "i_max_force": True,
+        "conv_rms_force": 5.0e-4,
+        "i_rms_force": True,
+        "conv_max_DE": 1.0e-6,
+        "i_max_DE": True,
+        "conv_max_disp": 1.0e-3,
+        "i_max_disp": True,
+        "conv_rms_disp": 5.0e-4,
+        "i_rms_disp": True,
+    },
+    "CFOUR": {
+        "i_untampered": True,
+        "conv_rms_force": 1.0e-4,
+        "i_rms_force": True,
+    },
+    "NWCHEM_LOOSE": {
+        "i_untampered": True,
+        "conv_max_force": 4.5e-3,
+        "i_max_force": True,
+        "conv_rms_force": 3.0e-3,
+        "i_rms_force": True,
+        "conv_max_disp": 5.4e-3,
+        "i_max_disp": True,
+        "conv_rms_disp": 3.6e-3,
+        "i_rms_disp": True,
+    },
+    "INTERFRAG_TIGHT": {
+        "i_untampered": True,
+        "conv_max_DE": 1.0e-5,
+        "i_max_DE": True,
+        "conv_max_force": 1.5e-5,
+        "i_max_force": True,
+        "conv_rms_force": 1.0e-5,
+        "i_rms_force": True,
+        "conv_max_disp": 6.0e-4,
+        "i_max_disp": True,
+        "conv_rms_disp": 4.0e-4,
+        "i_rms_disp": True,
+    },
+}
+
+# Settings applied by update_dynamic_level_params for each run_level, with the level and
+# message it logs.  run_level 0 keeps the user's settings.
+_RUN_LEVEL_TABLE = {
+    0: (None, None, {}),
+    1: (
+        logging.INFO,
+        "Going to run_level 1: Red. Int., RFO, no backsteps, default, dynamic trust. ~",
+        {"opt_coordinates": "REDUNDANT", "consecutiveBackstepsAllowed": 0, "step_type": "RFO"},
+    ),
+    2: (
+        logging.WARNING,
+        "Going to run_level 2: Red. Int., RFO, 2 backstep, smaller trust. ~",
+        {
+            "opt_coordinates": "REDUNDANT",
+            "consecutiveBackstepsAllowed": 2,
+            "step_type": "RFO",
+            "intrafrag_trust": 0.2,
+            "intrafrag_trust_min": 0.2,
+            "intrafrag_trust_max": 0.2,
+        },
+    ),
+    3: (
+        logging.WARNING,
+        "Going to run_level 3: Red. Int. + XYZ, RFO, 2 backstep, smaller trust. ~",
+        {
+            "opt_coordinates": "BOTH",
+            "consecutiveBackstepsAllowed": 2,
+            "step_type": "RFO",
+            "intrafrag_trust": 0.1,
+            "intrafrag_trust_min": 0.1,
+            "intrafrag_trust_max": 0.1,
+        },
     ),
-    "irc_direction": ("FORWARD", "BACKWARD"),
-    "g_convergence": (
-        "QCHEM",
-        "MOLPRO",
-        "GAU",
-        "GAU_LOOSE",
-        "GAU_TIGHT",
-        "GAU_VERYTIGHT",
-        "TURBOMOLE",
-        "CFOUR",
-        "NWCHEM_LOOSE",
-        "INTERFRAG_TIGHT",
+    4: (
+        logging.WARNING,
+        "Going to run_level 4: XYZ, RFO, 2 backstep, smaller trust. ~",
+        {
+            "opt_coordinates": "CARTESIAN",
+            "consecutiveBackstepsAllowed": 2,
+            "step_type": "RFO",
+            "intrafrag_hess": "LINDH",
+            "intrafrag_trust": 0.2,
+            "intrafrag_trust_min": 0.2,
+            "intrafrag_trust_max": 0.2,
+        },
+    ),
+    5: (
+        logging.WARNING,
+        "Going to run_level 5: XYZ, SD, 2 backstep, average trust. ~",
+        {
+            "opt_coordinates": "CARTESIAN",
+            "consecutiveBackstepsAllowed": 2,
+            "step_type": "SD",
+            "sd_hessian": 0.3,
+            "intrafrag_trust": 0.3,
+            "intrafrag_trust_min": 0.3,
+            "intrafrag_trust_max": 0.3,
+        },
+    ),
+    6: (
+        logging.WARNING,
+        "Moving to run_level 6: XYZ, SD, 2 backstep, smaller trust. ~",
+        {
+            "opt_coordinates": "CARTESIAN",
+            "consecutiveBackstepsAllowed": 2,
+            "step_type": "SD",
+            "sd_hessian": 0.6,
+            "intrafrag_trust": 0.1,
+            "intrafrag_trust_min": 0.1,
+            "intrafrag_trust_max": 0.1,
+        },
     ),
-    "hess_update": ("NONE", "BFGS", "MS", "POWELL", "BOFILL"),
-    "intrafrag_hess": ("SCHLEGEL", "FISCHER", "SCHLEGEL", "SIMPLE", "LINDH", "LINDH_SIMPLE"),
-    "frag_mode": ("SINGLE", "MULTI"),
-    "interfrag_mode": ("FIXED", "PRINCIPAL_AXES"),
-    "interfrag_hess": ("DEFAULT", "FISCHER_LIKE"),
-    "conjugate_gradient_type": ("FLETCHER", "DESCENT", "POLAK")
 }
 
 # def enum_key( enum_type, value):
@@ -64,163 +374,293 @@ allowedStringOptions = {
 
 
 class OptParams(object):
-    # define properties
-    opt_type = string_option("opt_type")
-    step_type = string_option("step_type")
-    opt_coordinates = string_option("opt_coordinates")
-    irc_direction = string_option("irc_direction")
-    g_convergence = string_option("g_convergence")
-    hess_update = string_option("hess_update")
-    intrafrag_hess = string_option("intrafrag_hess")
-    frag_mode = string_option("frag_mode")
-    conjugate_gradient_type = string_option("conjugate_gradient_type")
-
-    # interfrag_mode  = stringOption( 'interfrag_mode' )
-    # interfrag_hess  = stringOption( 'interfrag_hess' )
+    # Every attribute of OptParams must be listed here. Instances have no __dict__; use to_dict().
+    __slots__ = (
+        "program",
+        # Optimization algorithm
+        "geom_maxiter",
+        "alg_geom_maxiter",
+        "print_lvl",
+        "output_type",
+        "opt_type",
+        "step_type",
+        "steepest_descent_type",
+        "conjugate_gradient_type",
+        "opt_coordinates",
+        "rfo_follow_root",
+        "rfo_root",
+        "accept_symmetry_breaking",
+        "dynamic_level",
+        "dynamic_level_max",
+        "irc_step_size",
+        "irc_direction",
+        "irc_points",
+        "intrafrag_trust",
+        "intrafrag_trust_min",
+        "intrafrag_trust_max",
+        "interfrag_trust",
+        "interfrag_trust_min",
+        "interfrag_trust_max",
+        "ensure_bt_convergence",
+        "simple_step_scaling",
+        "consecutive_backsteps_allowed",
+        "consecutiveBackstepsAllowed",
+        "working_consecutive_backsteps",
+        "rfo_normalization_max",
+        "rsrfo_alpha_max",
+        "trajectory",
+        # Frozen, ranged, and externally forced coordinates
+        "frozen_distance",
+        "frozen_bend",
+        "frozen_dihedral",
+        "frozen_oofp",
+        "frozen_cartesian",
+        "ranged_distance",
+        "ranged_bend",
+        "ranged_dihedral",
+        "ranged_oofp",
+        "ranged_cartesian",
+        "ext_force_distance",
+        "ext_force_bend",
+        "ext_force_dihedral",
+        "ext_force_oofp",
+        "ext_force_cartesian",
+        "_has_ext_force",
+        # Convergence control
+        "g_convergence",
+        "max_force_g_convergence",
+        "rms_force_g_convergence",
+        "max_energy_g_convergence",
+        "max_disp_g_convergence",
+        "rms_disp_g_convergence",
+        "flexible_g_convergence",
+        # Hessian update and external Hessians
+        "hess_update",
+        "hess_update_use_last",
+        "hess_update_limit",
+        "hess_update_limit_max",
+        "hess_update_limit_scale",
+        "hess_update_den_tol",
+        "hess_update_dq_tol",
+        "cart_hess_read",
+        "read_cartesian_H",
+        "hessian_file",
+        "full_hess_every",
+        "intrafrag_hess",
+        "h_guess_every",
+        "H_guess_every",
+        "working_steps_since_last_H",
+        # Backtransformation
+        "bt_max_iter",
+        "bt_dx_conv",
+        "bt_dx_rms_change_conv",
+        "bt_pinv_rcond",
+        # Fragments and connectivity
+        "frag_mode",
+        "frag_ref_atoms",
+        "freeze_intrafrag",
+        "interfrag_mode",
+        "add_auxiliary_bonds",
+        "auxiliary_bond_factor",
+        "interfrag_dist_inv",
+        "interfrag_collinear_tol",
+        "interfrag_coords",
+        "covalent_connect",
+        "interfragment_connect",
+        "h_bond_connect",
+        "generate_intcos_exit",
+        "include_oofp",
+        # Misc.
+        "test_B",
+        "test_derivative_B",
+        "keep_intcos",
+        "linesearch_step",
+        "linesearch",
+        "sd_hessian",
+        "print_trajectory_xyz_file",
+        "fix_val_near_pi",
+        "v3d_tors_angle_lim",
+        "v3d_tors_cos_tol",
+        "linear_bend_threshold",
+        "small_bend_fix_threshold",
+        "redundant_eval_tol",
+        # Internal convergence criteria
+        "i_max_force",
+        "i_rms_force",
+        "i_max_DE",
+        "i_max_disp",
+        "i_rms_disp",
+        "i_untampered",
+        "conv_rms_force",
+        "conv_rms_disp",
+        "conv_max_DE",
+        "conv_max_force",
+        "conv_max_disp",
+    )
+    # Public parameters, in the order printed by __str__.
+    _PRINTABLE_ATTRS = tuple(attr for attr in __slots__ if not attr.startswith("_"))
 
     def __str__(self):
-        s = "\n\t\t -- Optimization Parameters --\n"
-        for attr in dir(self):
-            if not hasattr(getattr(self, attr), "__self__"):  # omit bound methods
-                if "__" not in attr:  # omit these methods
-                    s += "\t%-30s = %15s\n" % (attr, getattr(self, attr))
-        s += "\n"
-        return s
+        parts = ["\n\t\t -- Optimization Parameters --\n"]
+        parts.extend(
+            f"\t{attr:<30} = {getattr(self, attr)!s:>15}\n"
+            for attr in self._PRINTABLE_ATTRS
+            if hasattr(self, attr)
+        )
+        parts.append("\n")
+        return "".join(parts)
 
     def __init__(self, uod):
-        self.program = uod.get("program", "psi4")
+        # Normalize the user keys once so every lookup below is case-insensitive.
+        U = {k.upper(): v for k, v in uod.items()}
+        # User values take precedence over _DEFAULTS.
+        opts = {**_DEFAULTS, **U}
+        self.program = opts["PROGRAM"]
 
         # SUBSECTION Optimization Algorithm
 
         # Maximum number of geometry optimization steps
-        self.geom_maxiter = uod.get("geom_maxiter", 50)
+        self.geom_maxiter = opts["GEOM_MAXITER"]
         # If user sets one, assume this.
-        if "geom_maxiter" in uod and "alg_geom_maxiter" not in uod:
+        if "GEOM_MAXITER" in U and "ALG_GEOM_MAXITER" not in U:
             self.alg_geom_maxiter = self.geom_maxiter
         else:
             # Maximum number of geometry optimization steps for one algorithm
-            self.alg_geom_maxiter = uod.get("alg_geom_maxiter", 50)
+            self.alg_geom_maxiter = opts["ALG_GEOM_MAXITER"]
         # Print level.  1 = normal
         # P.print_lvl = uod.get('print_lvl', 1)
-        self.print_lvl = uod.get("print", 1)
+        self.print_lvl = opts["PRINT"]
         # Print all optimization parameters.
         # P.printxopt_params = uod.get('printxopt_PARAMS', False)
-        self.output_type = uod.get("OUTPUT_TYPE", "FILE")
+        self.output_type = opts["OUTPUT_TYPE"]
         # Specifies minimum search, transition-state search, or IRC following
         # P.stringOptionsSetter(stringOption('opt_type')
-        self.opt_type = uod.get("OPT_TYPE", "MIN")
+        self.opt_type = self._enum("opt_type", opts["OPT_TYPE"])
         # Geometry optimization step type, e.g., Newton-Raphson or Rational Function Optimization
-        self.step_type = uod.get("STEP_TYPE", "RFO")
+        self.step_type = self._enum("step_type", opts["STEP_TYPE"])
         # variation of steepest descent step size
-        self.steepest_descent_type = uod.get("STEEPEST_DESCENT_TYPE", "OVERLAP")
+        self.steepest_descent_type = opts["STEEPEST_DESCENT_TYPE"]
         # Conjugate gradient step types. See wikipedia on Nonlinear_conjugate_gradient
         # "POLAK" for Polak-Ribiere. Polak, E.; Ribière, G. (1969). 
         # Revue Française d'Automatique, Informatique, Recherche Opérationnelle. 3 (1): 35–43.
         # "FLETCHER" for Fletcher-Reeves.  Fletcher, R.; Reeves, C. M. (1964).
-        self.conjugate_gradient_type = uod.get("CONJUGATE_GRADIENT_TYPE", "FLETCHER")
+        self.conjugate_gradient_type = self._enum(
+            "conjugate_gradient_type", opts["CONJUGATE_GRADIENT_TYPE"]
+        )
         # Geometry optimization coordinates to use.
         # REDUNDANT and INTERNAL are synonyms and the default.
         # DELOCALIZED are the coordinates of Baker.
         # NATURAL are the coordinates of Pulay.
         # CARTESIAN uses only cartesian coordinates.
         # BOTH uses both redundant and cartesian coordinates.
-        self.opt_coordinates = uod.get("OPT_COORDINATES", "REDUNDANT")
+        self.opt_coordinates = self._enum("opt_coordinates", opts["OPT_COORDINATES"])
         # Do follow the initial RFO vector after the first step?
-        self.rfo_follow_root = uod.get("RFO_FOLLOW_ROOT", False)
+        self.rfo_follow_root = opts["RFO_FOLLOW_ROOT"]
         # Root for RFO to follow, 0 being lowest (typical for a minimum)
-        self.rfo_root = uod.get("RFO_ROOT", 0)
+        self.rfo_root = opts["RFO_ROOT"]
         # Whether to accept geometry steps that lower the molecular point group.
-        self.accept_symmetry_breaking = uod.get("ACCEPT_SYMMETRY_BREAKING", False)
+        self.accept_symmetry_breaking = opts["ACCEPT_SYMMETRY_BREAKING"]
         # Starting level for dynamic optimization (0=nondynamic, higher=>more conservative)
-        self.dynamic_level = uod.get("DYNAMIC_LEVEL", 0)
+        self.dynamic_level = opts["DYNAMIC_LEVEL"]
         if self.dynamic_level == 0:  # don't change parameters
             self.dynamic_level_max = 0
         else:
-            self.dynamic_level_max = uod.get("DYNAMIC_LEVEL_MAX", 6)  # 6 currently defined
+            self.dynamic_level_max = opts["DYNAMIC_LEVEL_MAX"]  # 6 currently defined
         # IRC step size in bohr(amu)\ $^{1/2}$.
-        self.irc_step_size = uod.get("IRC_STEP_SIZE", 0.2)
+        self.irc_step_size = opts["IRC_STEP_SIZE"]
         # IRC mapping direction
-        self.irc_direction = uod.get("IRC_DIRECTION", "FORWARD")
+        self.irc_direction = self._enum("irc_direction", opts["IRC_DIRECTION"])
         # Decide when to stop IRC calculations
-        self.irc_points = uod.get("IRC_POINTS", 20)
+        self.irc_points = opts["IRC_POINTS"]
         #
         # Initial maximum step size in bohr or radian along an internal coordinate
-        self.intrafrag_trust = uod.get("INTRAFRAG_STEP_LIMIT", 0.5)
+        self.intrafrag_trust = opts["INTRAFRAG_STEP_LIMIT"]
         # Lower bound for dynamic trust radius [a/u]
-        self.intrafrag_trust_min = uod.get("INTRAFRAG_STEP_LIMIT_MIN", 0.001)
+        self.intrafrag_trust_min = opts["INTRAFRAG_STEP_LIMIT_MIN"]
         # Upper bound for dynamic trust radius [au]
-        self.intrafrag_trust_max = uod.get("INTRAFRAG_STEP_LIMIT_MAX", 1.0)
+        self.intrafrag_trust_max = opts["INTRAFRAG_STEP_LIMIT_MAX"]
         # Maximum step size in bohr or radian along an interfragment coordinate
-        self.interfrag_trust = uod.get("INTERFRAG_TRUST", 0.5)
+        self.interfrag_trust = opts["INTERFRAG_TRUST"]
         # Lower bound for dynamic trust radius [a/u]
-        self.interfrag_trust_min = uod.get("INTERFRAG_TRUST_MIN", 0.001)
+        self.interfrag_trust_min = opts["INTERFRAG_TRUST_MIN"]
         # Upper bound for dynamic trust radius [au]
-        self.interfrag_trust_max = uod.get("INTERFRAG_TRUST_MAX", 1.0)
+        self.interfrag_trust_max = opts["INTERFRAG_TRUST_MAX"]
         # Reduce step size as necessary to ensure convergence of back-transformation of
         # internal coordinate step to cartesian coordinates.
-        self.ensure_bt_convergence = uod.get("ENSURE_BT_CONVERGENCE", False)
+        self.ensure_bt_convergence = opts["ENSURE_BT_CONVERGENCE"]
         # Do simple, linear scaling of internal coordinates to step limit (not RS-RFO)
         if self.intrafrag_trust_max < self.intrafrag_trust:
             self.intrafrag_trust = self.intrafrag_trust_max
 
-        self.simple_step_scaling = uod.get("SIMPLE_STEP_SCALING", False)
+        self.simple_step_scaling = opts["SIMPLE_STEP_SCALING"]
         # Set number of consecutive backward steps allowed in optimization
-        self.consecutive_backsteps_allowed = uod.get("CONSECUTIVE_BACKSTEPS", 0)
+        self.consecutive_backsteps_allowed = opts["CONSECUTIVE_BACKSTEPS"]
         self.working_consecutive_backsteps = 0
         # Eigenvectors of RFO matrix whose final column is smaller than this are ignored.
-        self.rfo_normalization_max = uod.get("RFO_NORMALIZATION_MAX", 100)
+        self.rfo_normalization_max = opts["RFO_NORMALIZATION_MAX"]
         # Absolute maximum value of RS-RFO.
-        self.rsrfo_alpha_max = uod.get("RSRFO_ALPHA_MAX", 1e8)
+        self.rsrfo_alpha_max = opts["RSRFO_ALPHA_MAX"]
         # New in python version
-        self.trajectory = uod.get("TRAJECTORY", False)
+        self.trajectory = opts["TRAJECTORY"]
 
+        # The coordinate strings below are only parsed when given; most optimizations set none.
+        _tok = tokenize_input_string
+        _il, _ifl, _ixfl = int_list, int_float_list, int_xyz_float_list
+        _ifx, _ixfx = int_fx_string, int_xyz_fx_string
         # Specify distances between atoms to be frozen (unchanged)
-        frozen = uod.get("FROZEN_DISTANCE", "")
-        self.frozen_distance = int_list(tokenize_input_string(frozen), 2)
+        frozen = opts["FROZEN_DISTANCE"]
+        self.frozen_distance = _il(_tok(frozen), 2) if frozen else _EMPTY
         # Specify angles between atoms to be frozen (unchanged)
-        frozen = uod.get("FROZEN_BEND", "")
-        self.frozen_bend = int_list(tokenize_input_string(frozen), 3)
+        frozen = opts["FROZEN_BEND"]
+        self.frozen_bend = _il(_tok(frozen), 3) if frozen else _EMPTY
         # Specify dihedral angles between atoms to be frozen (unchanged)
-        frozen = uod.get("FROZEN_DIHEDRAL", "")
-        self.frozen_dihedral = int_list(tokenize_input_string(frozen), 4)
+        frozen = opts["FROZEN_DIHEDRAL"]
+        self.frozen_dihedral = _il(_tok(frozen), 4) if frozen else _EMPTY
         # Specify out-of-plane angles between atoms to be frozen (unchanged)
-        frozen = uod.get("FROZEN_OOFP", "")
-        self.frozen_oofp = int_list(tokenize_input_string(frozen), 4)
+        frozen = opts["FROZEN_OOFP"]
+        self.frozen_oofp = _il(_tok(frozen), 4) if frozen else _EMPTY
         # Specify atom and X, XY, XYZ, ... to be frozen (unchanged)
-        frozen = uod.get("FROZEN_CARTESIAN", "")
-        self.frozen_cartesian = int_xyz_float_list(tokenize_input_string(frozen), 1, 1, 0)
+        frozen = opts["FROZEN_CARTESIAN"]
+        self.frozen_cartesian = _ixfl(_tok(frozen), 1, 1, 0) if frozen else _EMPTY
 
         # Specify distance between atoms to be ranged
-        ranged = uod.get("RANGED_DISTANCE", "")
-        self.ranged_distance = int_float_list(tokenize_input_string(ranged), 2, 2)
+        ranged = opts["RANGED_DISTANCE"]
+        self.ranged_distance = _ifl(_tok(ranged), 2, 2) if ranged else _EMPTY
         # Specify angles between atoms to be ranged
-        ranged = uod.get("RANGED_BEND", "")
-        self.ranged_bend = int_float_list(tokenize_input_string(ranged), 3, 2)
+        ranged = opts["RANGED_BEND"]
+        self.ranged_bend = _ifl(_tok(ranged), 3, 2) if ranged else _EMPTY
         # Specify dihedral angles between atoms to be ranged
-        ranged = uod.get("RANGED_DIHEDRAL", "")
-        self.ranged_dihedral = int_float_list(tokenize_input_string(ranged), 4, 2)
+        ranged = opts["RANGED_DIHEDRAL"]
+        self.ranged_dihedral = _ifl(_tok(ranged), 4, 2) if ranged else _EMPTY
         # Specify out-of-plane angles between atoms to be ranged
-        ranged = uod.get("RANGED_OOFP", "")
-        self.ranged_oofp = int_float_list(tokenize_input_string(ranged), 4, 2)
+        ranged = opts["RANGED_OOFP"]
+        self.ranged_oofp = _ifl(_tok(ranged), 4, 2) if ranged else _EMPTY
         # Specify atom and X, XY, XYZ, ... to be ranged
-        ranged = uod.get("RANGED_CARTESIAN", "")
-        self.ranged_cartesian = int_xyz_float_list(tokenize_input_string(ranged), 1, 1, 2)
+        ranged = opts["RANGED_CARTESIAN"]
+        self.ranged_cartesian = _ixfl(_tok(ranged), 1, 1, 2) if ranged else _EMPTY
 
         # Specify distances for which extra force will be added
-        force = uod.get("EXT_FORCE_DISTANCE", "")
-        self.ext_force_distance = int_fx_string(force, 2)
+        force = opts["EXT_FORCE_DISTANCE"]
+        self.ext_force_distance = _ifx(force, 2) if force else _EMPTY
         # Specify angles for which extra force will be added
-        force = uod.get("EXT_FORCE_BEND", "")
-        self.ext_force_bend = int_fx_string(force, 3)
+        force = opts["EXT_FORCE_BEND"]
+        self.ext_force_bend = _ifx(force, 3) if force else _EMPTY
         # Specify dihedral angles for which extra force will be added
-        force = uod.get("EXT_FORCE_DIHEDRAL", "")
-        self.ext_force_dihedral = int_fx_string(force, 4)
+        force = opts["EXT_FORCE_DIHEDRAL"]
+        self.ext_force_dihedral = _ifx(force, 4) if force else _EMPTY
         # Specify out-of-plane angles for which extra force will be added
-        force = uod.get("EXT_FORCE_OOFP", "")
-        self.ext_force_oofp = int_fx_string(force, 4)
+        force = opts["EXT_FORCE_OOFP"]
+        self.ext_force_oofp = _ifx(force, 4) if force else _EMPTY
         # Specify cartesian coordinates for which extra force will be added
-        force = uod.get("EXT_FORCE_CARTESIAN", "")
-        self.ext_force_cartesian = int_xyz_fx_string(force, 1)
+        force = opts["EXT_FORCE_CARTESIAN"]
+        self.ext_force_cartesian = _ixfx(force, 1) if force else _EMPTY
+        self._has_ext_force = (
+            bool(self.ext_force_distance)
+            or bool(self.ext_force_bend)
+            or bool(self.ext_force_dihedral)
+            or bool(self.ext_force_oofp)
+            or bool(self.ext_force_cartesian)
+        )
 
         # Should an xyz trajectory file be kept (useful for visualization)?
         # P.print_trajectory_xyz = uod.get('PRINT_TRAJECTORY_XYZ', False)
@@ -232,37 +672,37 @@ class OptParams(object):
         # RMS_*_G_CONVERGENCE options will append to overwrite the criteria set here
         # |optking__flexible_g_convergence| is also on.
         # See Table :ref:`Geometry Convergence <table:optkingconv>` for details.
-        self.g_convergence = uod.get("G_CONVERGENCE", "QCHEM")
+        self.g_convergence = self._enum("g_convergence", opts["G_CONVERGENCE"])
         # Convergence criterion for geometry optmization: maximum force (internal coordinates, au)
-        self.max_force_g_convergence = uod.get("MAX_FORCE_G_CONVERGENCE", 3.0e-4)
+        self.max_force_g_convergence = opts["MAX_FORCE_G_CONVERGENCE"]
         # Convergence criterion for geometry optmization: rms force  (internal coordinates, au)
-        self.rms_force_g_convergence = uod.get("RMS_FORCE_G_CONVERGENCE", 3.0e-4)
+        self.rms_force_g_convergence = opts["RMS_FORCE_G_CONVERGENCE"]
         # Convergence criterion for geometry optmization: maximum energy change
-        self.max_energy_g_convergence = uod.get("MAX_ENERGY_G_CONVERGENCE", 1.0e-6)
+        self.max_energy_g_convergence = opts["MAX_ENERGY_G_CONVERGENCE"]
         # Convergence criterion for geometry optmization:
         # maximum displacement (internal coordinates, au)
-        self.max_disp_g_convergence = uod.get("MAX_DISP_G_CONVERGENCE", 1.2e-3)
+        self.max_disp_g_convergence = opts["MAX_DISP_G_CONVERGENCE"]
         # Convergence criterion for geometry optmization:
         # rms displacement (internal coordinates, au)
-        self.rms_disp_g_convergence = uod.get("RMS_DISP_G_CONVERGENCE", 1.2e-3)
+        self.rms_disp_g_convergence = opts["RMS_DISP_G_CONVERGENCE"]
         # Even if a user-defined threshold is set, allow for normal, flexible convergence criteria
-        self.flexible_g_convergence = uod.get("FLEXIBLE_G_CONVERGENCE", False)
+        self.flexible_g_convergence = opts["FLEXIBLE_G_CONVERGENCE"]
         #
         # SUBSECTION Hessian Update
         # Hessian update scheme
-        self.hess_update = uod.get("HESS_UPDATE", "BFGS")
+        self.hess_update = self._enum("hess_update", opts["HESS_UPDATE"])
         # Number of previous steps to use in Hessian update, 0 uses all
-        self.hess_update_use_last = uod.get("HESS_UPDATE_USE_LAST", 4)
+        self.hess_update_use_last = opts["HESS_UPDATE_USE_LAST"]
         # Do limit the magnitude of changes caused by the Hessian update?
-        self.hess_update_limit = uod.get("HESS_UPDATE_LIMIT", True)
+        self.hess_update_limit = opts["HESS_UPDATE_LIMIT"]
         # If |hess_update_limit| is True, changes to the Hessian from the update are limited
         # to the larger of |hess_update_limit_scale| * (current value) and
         # |hess_update_limit_max| [au].  By default, a Hessian value cannot be changed by more
         # than 50% and 1 au.
-        self.hess_update_limit_max = uod.get("HESS_UPDATE_LIMIT_MAX", 1.00)
-        self.hess_update_limit_scale = uod.get("HESS_UPDATE_LIMIT_SCALE", 0.50)
+        self.hess_update_limit_max = opts["HESS_UPDATE_LIMIT_MAX"]
+        self.hess_update_limit_scale = opts["HESS_UPDATE_LIMIT_SCALE"]
         # Denominator check for hessian update.
-        self.hess_update_den_tol = uod.get("HESS_UPDATE_DEN_TOL", 1e-7)
+        self.hess_update_den_tol = opts["HESS_UPDATE_DEN_TOL"]
         # Hessian update is avoided if any internal coordinate has changed by
         # more than this in radians/au
         self.hess_update_dq_tol = 0.5
@@ -270,56 +710,56 @@ class OptParams(object):
         # SUBSECTION Using external Hessians
         # Do read Cartesian Hessian?  Only for experts - use
         # |optking__full_hess_every| instead.
-        self.cart_hess_read = uod.get("CART_HESS_READ", False)
-        self.hessian_file = uod.get("HESSIAN_FILE", None)
+        self.cart_hess_read = opts["CART_HESS_READ"]
+        self.hessian_file = opts["HESSIAN_FILE"]
         # Frequency with which to compute the full Hessian in the course
         # of a geometry optimization. 0 means to compute the initial Hessian only,
         # 1 means recompute every step, and N means recompute every N steps. The
         # default (-1) is to never compute the full Hessian.
-        self.full_hess_every = uod.get("FULL_HESS_EVERY", -1)
+        self.full_hess_every = opts["FULL_HESS_EVERY"]
         # Model Hessian to guess intrafragment force constants
-        self.intrafrag_hess = uod.get("INTRAFRAG_HESS", "SCHLEGEL")
+        self.intrafrag_hess = self._enum("intrafrag_hess", opts["INTRAFRAG_HESS"])
         # Re-estimate the Hessian at every step, i.e., ignore the currently stored Hessian.
         # self.h_guess_every = uod.get("H_GUESS_EVERY", False)
 
         self.working_steps_since_last_H = 0
         #
         # SUBSECTION Backtransformation to Cartesian Coordinates Control
-        self.bt_max_iter = uod.get("bt_max_iter", 25)
-        self.bt_dx_conv = uod.get("bt_dx_conv", 1.0e-7)
-        self.bt_dx_rms_change_conv = uod.get("bt_dx_rms_change_conv", 1.0e-12)
+        self.bt_max_iter = opts["BT_MAX_ITER"]
+        self.bt_dx_conv = opts["BT_DX_CONV"]
+        self.bt_dx_rms_change_conv = opts["BT_DX_RMS_CHANGE_CONV"]
         # The following should be used whenever redundancies in the coordinates
         # are removed, in particular when forces and Hessian are projected and
         # in back-transformation from delta(q) to delta(x).
-        self.bt_pinv_rcond = uod.get("bt_pinv_rcond", 1.0e-6)
+        self.bt_pinv_rcond = opts["BT_PINV_RCOND"]
         #
         # For multi-fragment molecules, treat as single bonded molecule or via interfragment
         # coordinates. A primary difference is that in ``MULTI`` mode, the interfragment
         # coordinates are not redundant.
-        self.frag_mode = uod.get("FRAG_MODE", "SINGLE")
+        self.frag_mode = self._enum("frag_mode", opts["FRAG_MODE"])
         # Which atoms define the reference points for interfragment coordinates?
-        self.frag_ref_atoms = uod.get("FRAG_REF_ATOMS", None)
+        self.frag_ref_atoms = opts["FRAG_REF_ATOMS"]
         # Do freeze all fragments rigid?
-        self.freeze_intrafrag = uod.get("FREEZE_INTRAFRAG", False)
+        self.freeze_intrafrag = opts["FREEZE_INTRAFRAG"]
         # Do freeze all interfragment modes?
         # P.inter_frag = uod.get('FREEZE_INTERFRAG', False)
         # When interfragment coordinates are present, use as reference points either
         # principal axes or fixed linear combinations of atoms.
-        self.interfrag_mode = uod.get("INTERFRAG_MODE", "FIXED")
+        self.interfrag_mode = opts["INTERFRAG_MODE"]
         # Do add bond coordinates at nearby atoms for non-bonded systems?
-        self.add_auxiliary_bonds = uod.get('ADD_AUXILIARY_BONDS', False)
+        self.add_auxiliary_bonds = opts["ADD_AUXILIARY_BONDS"]
         # This factor times standard covalent distance is used to add extra stretch coordinates.
-        self.auxiliary_bond_factor = uod.get('AUXILIARY_BOND_FACTOR', 2.5)
+        self.auxiliary_bond_factor = opts["AUXILIARY_BOND_FACTOR"]
         # Do use 1/R for the interfragment stretching coordinate instead of R?
-        self.interfrag_dist_inv = uod.get("INTERFRAG_DIST_INV", False)
+        self.interfrag_dist_inv = opts["INTERFRAG_DIST_INV"]
         # Used for determining which atoms in a system are too collinear to
         # be chosen as default reference atoms. We avoid collinearity. Greater
         # is more restrictive.
-        self.interfrag_collinear_tol = uod.get("INTERFRAG_COLLINEAR_TOL", 0.01)
+        self.interfrag_collinear_tol = opts["INTERFRAG_COLLINEAR_TOL"]
 
         # Let the user submit a dictionary (or array of dictionaries) for
         # the interfrag coordinates.
-        self.interfrag_coords = uod.get("INTERFRAG_COORDS", None)
+        self.interfrag_coords = opts["INTERFRAG_COORDS"]
 
         # Finish multifragment option setup by forcing frag_mode: MULTI if DimerCoords are provided
         if self.interfrag_coords is not None:
@@ -329,18 +769,18 @@ class OptParams(object):
         # P.interfrag_hess = uod.get('INTERFRAG_HESS', 'DEFAULT')
         # When determining connectivity, a bond is assigned if interatomic distance
         # is less than (this number) * sum of covalent radii.
-        self.covalent_connect = uod.get("COVALENT_CONNECT", 1.3)
+        self.covalent_connect = opts["COVALENT_CONNECT"]
         # When connecting disparate fragments when frag_mode = SIMPLE, a "bond"
         # is assigned if interatomic distance is less than (this number) * sum of covalent radii.
         # The value is then increased until all the fragments are connected directly
         # or indirectly.
-        self.interfragment_connect = uod.get("INTERFRAGMENT_CONNECT", 1.8)
+        self.interfragment_connect = opts["INTERFRAGMENT_CONNECT"]
         # General, maximum distance for the definition of H-bonds.
-        self.h_bond_connect = uod.get("h_bond_connect", 4.3)
+        self.h_bond_connect = opts["H_BOND_CONNECT"]
         # Only generate the internal coordinates and then stop (boolean)
-        self.generate_intcos_exit = uod.get("GENERATE_INTCOS_EXIT", False)
+        self.generate_intcos_exit = opts["GENERATE_INTCOS_EXIT"]
         # Add out-of-plane angles (usually not needed)
-        self.include_oofp = uod.get("INCLUDE_OOFP", False)
+        self.include_oofp = opts["INCLUDE_OOFP"]
         #
         #
         # SUBSECTION Misc.
@@ -350,84 +790,53 @@ class OptParams(object):
         # the convergence criteria.
         # P.final_geom_write = uod.get('FINAL_GEOM_WRITE', False)
         # Do test B matrix?
-        self.test_B = uod.get("TEST_B", False)
+        self.test_B = opts["TEST_B"]
         # Do test derivative B matrix?
-        self.test_derivative_B = uod.get("TEST_DERIVATIVE_B", False)
+        self.test_derivative_B = opts["TEST_DERIVATIVE_B"]
         # Keep internal coordinate definition file.
-        self.keep_intcos = uod.get("KEEP_INTCOS", False)
-        self.linesearch_step = uod.get("LINESEARCH_STEP", 0.100)
-        self.linesearch = uod.get("LINESEARCH", False)
+        self.keep_intcos = opts["KEEP_INTCOS"]
+        self.linesearch_step = opts["LINESEARCH_STEP"]
+        self.linesearch = opts["LINESEARCH"]
         # Guess at Hessian in steepest-descent direction.
-        self.sd_hessian = uod.get("SD_HESSIAN", 1.0)
+        self.sd_hessian = opts["SD_HESSIAN"]
         #
         # --- Complicated defaults ---
         #
-        # Assume RFO means P-RFO for transition states.
-        if self.opt_type == "TS":
-            if self.step_type == "RFO" or "STEP_TYPE" not in uod:
-                self.step_type = "RS_I_RFO"
-                self.intrafrag_trust = 0.2
-
-        if "GEOM_MAXITER" not in uod:
-            if self.opt_type == "IRC":
-                self.geom_maxiter = self.irc_points * self.geom_maxiter
+        # Defaults which depend on opt_type. See _POST_OPT_TYPE.
+        post_opt_type = _POST_OPT_TYPE.get(self.opt_type)
+        if post_opt_type is not None:
+            post_opt_type(self, U)
 
         # Initial Hessian guess for cartesians with coordinates BOTH is stupid, so don't scale
         #   step size down too much.  Steepest descent has no good hessian either.
-        if "INTRAFRAG_TRUST_MIN" not in uod:
+        if "INTRAFRAG_TRUST_MIN" not in U:
             if self.opt_coordinates == "BOTH":
                 self.intrafrag_trust_min = self.intrafrag_trust / 2.0
             elif self.step_type == "SD":  # steepest descent, use constant stepsize
                 self.intrafrag_trust_min = self.intrafrag_trust
-            elif any(
-                [
-                    self.ext_force_distance,
-                    self.ext_force_bend,
-                    self.ext_force_dihedral,
-                    self.ext_force_oofp,
-                    self.ext_force_cartesian,
-                ]
-            ):
+            elif self._has_ext_force:
                 # with external forces, the check for trust radius will be inapt
                 # so don't let minimum step get shrunk too much.
                 self.intrafrag_trust_min = self.intrafrag_trust / 2.0
 
         # Original Lindh specification was to redo at every step.
-        if "H_GUESS_EVERY" not in uod and self.intrafrag_hess == "LINDH":
+        if "H_GUESS_EVERY" not in U and self.intrafrag_hess == "LINDH":
             self.h_guess_every = True
 
         # Default for cartesians: use Lindh force field for initial guess, then BFGS.
         if self.opt_coordinates == "CARTESIAN":
-            if "INTRAFRAG_HESS" not in uod:
+            if "INTRAFRAG_HESS" not in U:
                 self.intrafrag_hess = "LINDH"
-                if "H_GUESS_EVERY" not in uod:
+                if "H_GUESS_EVERY" not in U:
                     self.H_guess_every = False
 
-        # Set Bofill as default for TS optimizations.
-        if self.opt_type == "TS" or self.opt_type == "IRC":
-            if "HESS_UPDATE" not in uod:
-                self.hess_update = "BOFILL"
-
-        # Make trajectory file printing the default for IRC.
-        if self.opt_type == "IRC" and "PRINT_TRAJECTORY_XYZ_FILE" not in uod:
-            self.print_trajectory_xyz_file = True
-
-        # Read cartesian Hessian by default for IRC.
-        if self.opt_type == "IRC" and "CART_HESS_READ" not in uod:
-            self.read_cartesian_H = True
-
         if self.generate_intcos_exit:
             self.keep_intcos = True
 
-        # For IRC, we will need a Hessian.  Compute it if not provided.
-        # Set full_hess_every to 0 if -1
-        if self.opt_type == "IRC" and self.full_hess_every < 0:
-            self.full_hess_every = 0
-            # self.cart_hess_read = True  # not sure about this one - test
-
-        # if steepest-descent, then make much larger default
-        if self.step_type == "SD" and "CONSECUTIVE_BACKSTEPS" not in uod:
-            self.consecutive_backsteps_allowed = 10
+        # Defaults which depend on the final step_type. See _POST_STEP_TYPE.
+        post_step_type = _POST_STEP_TYPE.get(self.step_type)
+        if post_step_type is not None:
+            post_step_type(self, U)
 
         # For RFO step, eigenvectors of augmented Hessian are divided by the last
         # element unless it is smaller than this value {double}.  Can be used to
@@ -465,133 +874,32 @@ class OptParams(object):
         self.redundant_eval_tol = 1.0e-10 # to be deprecated.
         #
         # --- SET INTERNAL OPTIMIZATION PARAMETERS ---
-        self.i_max_force = False
-        self.i_rms_force = False
-        self.i_max_DE = False
-        self.i_max_disp = False
-        self.i_rms_disp = False
-        self.i_untampered = False
-        self.conv_rms_force = -1
-        self.conv_rms_disp = -1
-        self.conv_max_DE = -1
-        self.conv_max_force = -1
-        self.conv_max_disp = -1
         #
-        if self.g_convergence == "QCHEM":
-            self.i_untampered = True
-            self.conv_max_force = 3.0e-4
-            self.i_max_force = True
-            self.conv_max_DE = 1.0e-6
-            self.i_max_DE = True
-            self.conv_max_disp = 1.2e-3
-            self.i_max_disp = True
-        elif self.g_convergence == "MOLPRO":
-            self.i_untampered = True
-            self.conv_max_force = 3.0e-4
-            self.i_max_force = True
-            self.conv_max_DE = 1.0e-6
-            self.i_max_DE = True
-            self.conv_max_disp = 3.0e-4
-            self.i_max_disp = True
-        elif self.g_convergence == "GAU":
-            self.i_untampered = True
-            self.conv_max_force = 4.5e-4
-            self.i_max_force = True
-            self.conv_rms_force = 3.0e-4
-            self.i_rms_force = True
-            self.conv_max_disp = 1.8e-3
-            self.i_max_disp = True
-            self.conv_rms_disp = 1.2e-3
-            self.i_rms_disp = True
-        elif self.g_convergence == "GAU_TIGHT":
-            self.i_untampered = True
-            self.conv_max_force = 1.5e-5
-            self.i_max_force = True
-            self.conv_rms_force = 1.0e-5
-            self.i_rms_force = True
-            self.conv_max_disp = 6.0e-5
-            self.i_max_disp = True
-            self.conv_rms_disp = 4.0e-5
-            self.i_rms_disp = True
-        elif self.g_convergence == "GAU_VERYTIGHT":
-            self.i_untampered = True
-            self.conv_max_force = 2.0e-6
-            self.i_max_force = True
-            self.conv_rms_force = 1.0e-6
-            self.i_rms_force = True
-            self.conv_max_disp = 6.0e-6
-            self.i_max_disp = True
-            self.conv_rms_disp = 4.0e-6
-            self.i_rms_disp = True
-        elif self.g_convergence == "GAU_LOOSE":
-            self.i_untampered = True
-            self.conv_max_force = 2.5e-3
-            self.i_max_force = True
-            self.conv_rms_force = 1.7e-3
-            self.i_rms_force = True
-            self.conv_max_disp = 1.0e-2
-            self.i_max_disp = True
-            self.conv_rms_disp = 6.7e-3
-            self.i_rms_disp = True
-        elif self.g_convergence == "TURBOMOLE":
-            self.i_untampered = True
-            self.conv_max_force = 1.0e-3
-            self.i_max_force = True
-            self.conv_rms_force = 5.0e-4
-            self.i_rms_force = True
-            self.conv_max_DE = 1.0e-6
-            self.i_max_DE = True
-            self.conv_max_disp = 1.0e-3
-            self.i_max_disp = True
-            self.conv_rms_disp = 5.0e-4
-            self.i_rms_disp = True
-        elif self.g_convergence == "CFOUR":
-            self.i_untampered = True
-            self.conv_rms_force = 1.0e-4
-            self.i_rms_force = True
-        elif self.g_convergence == "NWCHEM_LOOSE":
-            self.i_untampered = True
-            self.conv_max_force = 4.5e-3
-            self.i_max_force = True
-            self.conv_rms_force = 3.0e-3
-            self.i_rms_force = True
-            self.conv_max_disp = 5.4e-3
-            self.i_max_disp = True
-            self.conv_rms_disp = 3.6e-3
-            self.i_rms_disp = True
-        elif self.g_convergence == "INTERFRAG_TIGHT":
-            self.i_untampered = True
-            self.conv_max_DE = 1.0e-5
-            self.i_max_DE = True
-            self.conv_max_force = 1.5e-5
-            self.i_max_force = True
-            self.conv_rms_force = 1.0e-5
-            self.i_rms_force = True
-            self.conv_max_disp = 6.0e-4
-            self.i_max_disp = True
-            self.conv_rms_disp = 4.0e-4
-            self.i_rms_disp = True
-
-
+        for key, val in _DEFAULT_CONV.items():
+            setattr(self, key, val)
+        # The preset is entirely overwritten below if the user gave all five criteria.
+        if U.keys() & _CONV_USER_KEYS != _CONV_USER_KEYS:
+            for key, val in _G_CONV_TABLE[self.g_convergence].items():
+                setattr(self, key, val)
 
         # ---  Specific optimization criteria
-        if "MAX_FORCE_G_CONVERGENCE" in uod:
+        if "MAX_FORCE_G_CONVERGENCE" in U:
             self.i_untampered = False
             self.i_max_force = True
             self.conv_max_force = self.max_force_g_convergence
-        if "RMS_FORCE_G_CONVERGENCE" in uod:
+        if "RMS_FORCE_G_CONVERGENCE" in U:
             self.i_untampered = False
             self.i_rms_force = True
             self.conv_rms_force = self.rms_force_g_convergence
-        if "MAX_ENERGY_G_CONVERGENCE" in uod:
+        if "MAX_ENERGY_G_CONVERGENCE" in U:
             self.i_untampered = False
             self.i_max_DE = True
             self.conv_max_DE = self.max_energy_g_convergence
-        if "MAX_DISP_G_CONVERGENCE" in uod:
+        if "MAX_DISP_G_CONVERGENCE" in U:
             self.i_untampered = False
             self.i_max_disp = True
             self.conv_max_disp = self.max_disp_g_convergence
-        if "RMS_DISP_G_CONVERGENCE" in uod:
+        if "RMS_DISP_G_CONVERGENCE" in U:
             self.i_untampered = False
             self.i_rms_disp = True
             self.conv_rms_disp = self.rms_disp_g_convergence
@@ -601,21 +909,58 @@ class OptParams(object):
             self.i_untampered = True
         # end __init__ finally !
 
+    def _enum(self, name, value):
+        """Validate an enumerated string option and return it, interned, in upper-case."""
+        value = value.upper()
+        if value not in allowedStringOptions[name]:
+            raise OptError("Invalid value for " + name)
+        return sys.intern(value)
+
+    @classmethod
+    def get(cls, uod):
+        """Return parameters for uod. Constructions from identical, hashable user options are cached.
+        The caller gets a copy of the cached parameters whose attributes, including list-valued ones
+        such as frozen_distance and its nested lists, may be modified freely.
+        """
+        try:
+            key = cls._canon(uod)
+        except TypeError:  # unhashable option values, e.g. INTERFRAG_COORDS or FRAG_REF_ATOMS
+            return cls(uod)
+        params = copy.copy(_build(cls, key))
+        # copy.copy shares the parsed coordinate lists with the cached instance; copy those so it
+        # stays pristine.  Absent lists are the immutable _EMPTY and can stay shared.
+        for attr in _COORD_LIST_ATTRS:
+            value = getattr(params, attr)
+            if value is not _EMPTY:
+                setattr(params, attr, copy.deepcopy(value))
+        return params
+
+    @staticmethod
+    def _canon(uod):
+        # The value's type is part of the key so that, e.g., 1 and True are not confused.
+        return frozenset((k.upper(), type(v), v) for k, v in uod.items())
+
     @classmethod
     def from_internal_dict(cls, params):
         """Assumes that params does not use the input key and syntax, but uses the internal names and
         internal syntax. Meant to be used for recreating options object after dump to dict
         """
         options = cls({})  # basic default options
-        opt_dict = options.__dict__
 
-        for key, val in opt_dict.items():
-            options.__dict__[key] = params.get(key, val)
+        for key in options.__slots__:
+            if key in params:
+                setattr(options, key, params[key])
 
         return options
 
+    def to_dict(self):
+        """Return the parameters which have been set as a dictionary keyed by the internal names."""
+        return {key: getattr(self, key) for key in self.__slots__ if hasattr(self, key)}
+
     # for specialists
     def __setitem__(self, key, value):
+        if key in allowedStringOptions:
+            value = self._enum(key, value)
         return setattr(self, key, value)
 
     def update_dynamic_level_params(self, run_level):
@@ -638,58 +983,66 @@ class OptParams(object):
         *   DE > 0 and backsteps exceeded and iterations > 5  ** OR **
         *   badly defined internal coordinate or derivative
         """
-        if run_level == 0:
-            pass
-        elif run_level == 1:
-            self.opt_coordinates = "REDUNDANT"
-            self.consecutiveBackstepsAllowed = 0
-            self.step_type = "RFO"
-            logger.info("Going to run_level 1: Red. Int., RFO, no backsteps, default, dynamic trust. ~")
-        elif run_level == 2:
-            self.opt_coordinates = "REDUNDANT"
-            self.consecutiveBackstepsAllowed = 2
-            self.step_type = "RFO"
-            self.intrafrag_trust = 0.2
-            self.intrafrag_trust_min = 0.2
-            self.intrafrag_trust_max = 0.2
-            logger.warning("Going to run_level 2: Red. Int., RFO, 2 backstep, smaller trust. ~")
-        elif run_level == 3:
-            self.opt_coordinates = "BOTH"
-            self.consecutiveBackstepsAllowed = 2
-            self.step_type = "RFO"
-            self.intrafrag_trust = 0.1
-            self.intrafrag_trust_min = 0.1
-            self.intrafrag_trust_max = 0.1
-            logger.warning("Going to run_level 3: Red. Int. + XYZ, RFO, 2 backstep, smaller trust. ~")
-        elif run_level == 4:
-            self.opt_coordinates = "CARTESIAN"
-            self.consecutiveBackstepsAllowed = 2
-            self.step_type = "RFO"
-            self.intrafrag_hess = "LINDH"
-            self.intrafrag_trust = 0.2
-            self.intrafrag_trust_min = 0.2
-            self.intrafrag_trust_max = 0.2
-            logger.warning("Going to run_level 4: XYZ, RFO, 2 backstep, smaller trust. ~")
-        elif run_level == 5:
-            self.opt_coordinates = "CARTESIAN"
-            self.consecutiveBackstepsAllowed = 2
-            self.step_type = "SD"
-            self.sd_hessian = 0.3
-            self.intrafrag_trust = 0.3
-            self.intrafrag_trust_min = 0.3
-            self.intrafrag_trust_max = 0.3
-            logger.warning("Going to run_level 5: XYZ, SD, 2 backstep, average trust. ~")
-        elif run_level == 6:
-            self.opt_coordinates = "CARTESIAN"
-            self.consecutiveBackstepsAllowed = 2
-            self.step_type = "SD"
-            self.sd_hessian = 0.6
-            self.intrafrag_trust = 0.1
-            self.intrafrag_trust_min = 0.1
-            self.intrafrag_trust_max = 0.1
-            logger.warning("Moving to run_level 6: XYZ, SD, 2 backstep, smaller trust. ~")
-        else:
+        try:
+            level, message, settings = _RUN_LEVEL_TABLE[run_level]
+        except KeyError:
             raise OptError("Unknown value of run_level")
 
+        for key, value in settings.items():
+            setattr(self, key, value)
+        if message:
+            logger.log(level, message)
+
+
+# --- Complicated defaults, keyed by opt_type or step_type ---
+# Each function receives the OptParams being constructed and the upper-cased user options.
+# The opt_type functions run before the remaining defaults, which may depend on the step_type they set.
+def _post_ts(params, U):
+    # Assume RFO means P-RFO for transition states.
+    if params.step_type == "RFO" or "STEP_TYPE" not in U:
+        params.step_type = "RS_I_RFO"
+        params.intrafrag_trust = 0.2
+
+    # Set Bofill as default for TS optimizations.
+    if "HESS_UPDATE" not in U:
+        params.hess_update = "BOFILL"
+
+
+def _post_irc(params, U):
+    if "GEOM_MAXITER" not in U:
+        params.geom_maxiter = params.irc_points * params.geom_maxiter
+
+    if "HESS_UPDATE" not in U:
+        params.hess_update = "BOFILL"
+
+    # Make trajectory file printing the default for IRC.
+    if "PRINT_TRAJECTORY_XYZ_FILE" not in U:
+        params.print_trajectory_xyz_file = True
+
+    # Read cartesian Hessian by default for IRC.
+    if "CART_HESS_READ" not in U:
+        params.read_cartesian_H = True
+
+    # For IRC, we will need a Hessian.  Compute it if not provided.
+    # Set full_hess_every to 0 if -1
+    if params.full_hess_every < 0:
+        params.full_hess_every = 0
+        # params.cart_hess_read = True  # not sure about this one - test
+
+
+def _post_sd(params, U):
+    # if steepest-descent, then make much larger default
+    if "CONSECUTIVE_BACKSTEPS" not in U:
+        params.consecutive_backsteps_allowed = 10
+
+
+_POST_OPT_TYPE = {"TS": _post_ts, "IRC": _post_irc}
+_POST_STEP_TYPE = {"SD": _post_sd}
+
+
+@functools.lru_cache(maxsize=32)
+def _build(cls, key):
+    return cls({k: v for k, _, v in key})
+
 
 Params = 0
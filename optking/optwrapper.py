@@ -1,6 +1,5 @@
 # wrapper for optking's optimize function for input by psi4API
 # creates a moleuclar system from psi4s and generates optkings options from psi4's lsit of options
-import copy
 import json
 import logging
 
@@ -49,7 +48,6 @@ def optimize_psi4(calc_name, program="psi4", dertype=None, **xtra_opt_params):
         op.Params, oMolsys, computer, opt_input = initialize_from_psi4(
             calc_name, program, computer_type="psi4", dertype=dertype, **xtra_opt_params
         )
-        opt_output = copy.deepcopy(opt_input)
         opt_output = optimize(oMolsys, computer)
     except (OptError, KeyError, ValueError, AttributeError) as error:
         opt_output = {
@@ -164,7 +162,7 @@ def optimize_qcengine(opt_input, computer_type="qc"):
 
     if isinstance(opt_input, OptimizationInput):
         opt_input = json.loads(json_dumps(opt_input))  # Remove numpy elements turn into dictionary
-    opt_output = copy.deepcopy(opt_input)
+    opt_output = {}
 
     # Make basic optking molecular system
     oMolsys = molsys.Molsys.from_schema(opt_input["initial_molecule"])
@@ -199,8 +197,9 @@ def make_computer(opt_input: dict, computer_type):
     logger.debug("Creating a Compute Wrapper")
     program = op.Params.program
 
-    # This gets updated so it shouldn't be a reference
-    molecule = copy.deepcopy(opt_input["initial_molecule"])
+    # The computer rebinds "geometry" on every step, so the top level can't be a reference. Nothing
+    # below it is mutated in place, so a shallow copy will do.
+    molecule = dict(opt_input["initial_molecule"])
 
     # Sorting by spec_schema_name isn't foolproof b/c opt_input might not be a
     #   constructed model at this point if it's not arriving through QCEngine.
@@ -235,7 +234,7 @@ def initialize_options(opt_keys, silent=False):
 
     # Create full list of parameters from user options plus defaults.
     try:
-        op.Params = op.OptParams(userOptions)
+        op.Params = op.OptParams.get(userOptions)
     except (KeyError, ValueError, AttributeError) as e:
         logger.error(str(e))
         raise OptError("unable to parse params from userOptions")
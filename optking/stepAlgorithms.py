@@ -181,7 +181,7 @@ class OptimizationAlgorithm(OptimizationInterface):
             fq,
             ensure_convergence=self.params.ensure_bt_convergence,
             return_str=return_str,
-            **self.params.__dict__,
+            **self.params.to_dict(),
         )
         dq_norm, unit_dq, projected_fq, projected_hess = self.step_metrics(
             achieved_dq, fq, H
@@ -290,7 +290,7 @@ class OptimizationAlgorithm(OptimizationInterface):
             "iternum": step_number,
         }
         converged = convcheck.conv_check(
-            conv_info, self.params.__dict__, str_mode=str_mode
+            conv_info, self.params.to_dict(), str_mode=str_mode
         )
         if str_mode:
             return converged
@@ -450,7 +450,7 @@ def test_convergence_presets(conv_test, conv_preset):
         criteria = _create_variations(defaults, changes, random_scale)
 
         optking.optwrapper.initialize_options({"g_convergence": conv_preset})
-        params_dict = optking.optparams.Params.__dict__
+        params_dict = optking.optparams.Params.to_dict()
 
         # Actual conv_check test.
         conv_met, conv_active = optking.convcheck._transform_criteria(criteria, params_dict)
@@ -512,7 +512,7 @@ def test_user_tampering(conv_options, test_name, preset, flexible_on):
 
     keys = ["max_DE", "max_force", "rms_force", "max_disp", "rms_disp"]
 
-    opt_params = optking.optparams.Params.__dict__
+    opt_params = optking.optparams.Params.to_dict()
     thresh1 = [opt_params.get(f"conv_{key}") for key in keys]
     thresholds = [val if val > 0 else 0.1 for val in thresh1]
 
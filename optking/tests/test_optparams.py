@@ -0,0 +1,105 @@
+#! Test construction of OptParams from user option dictionaries.
+import pytest
+
+import optking
+
+
+def test_uod_keys_case_insensitive():
+    lower = optking.optparams.OptParams({"geom_maxiter": 7, "opt_type": "ts", "full_hess_every": 2})
+    upper = optking.optparams.OptParams({"GEOM_MAXITER": 7, "OPT_TYPE": "TS", "FULL_HESS_EVERY": 2})
+
+    for params in (lower, upper):
+        assert params.geom_maxiter == 7
+        assert params.alg_geom_maxiter == 7
+        assert params.opt_type == "TS"
+        assert params.step_type == "RS_I_RFO"
+        assert params.full_hess_every == 2
+
+
+def test_enumerated_options():
+    params = optking.optparams.OptParams({"step_type": "nr", "hess_update": "Bofill"})
+    assert params.step_type == "NR"
+    assert params.hess_update == "BOFILL"
+
+    with pytest.raises(optking.exceptions.OptError):
+        optking.optparams.OptParams({"g_convergence": "not_a_preset"})
+
+
+def test_cached_construction():
+    first = optking.optparams.OptParams.get({"opt_type": "TS", "geom_maxiter": 10})
+    first.intrafrag_trust = 0.05
+    second = optking.optparams.OptParams.get({"OPT_TYPE": "ts", "GEOM_MAXITER": 10})
+
+    assert first is not second
+    assert second.intrafrag_trust == 0.2
+    assert second.to_dict() == optking.optparams.OptParams({"opt_type": "TS", "geom_maxiter": 10}).to_dict()
+
+    # 1 and True hash alike but must not share a cache entry
+    assert optking.optparams.OptParams.get({"test_B": 1}).test_B is not True
+
+    # unhashable values bypass the cache
+    params = optking.optparams.OptParams.get({"frag_ref_atoms": [[[1]], [[2]]]})
+    assert params.frag_ref_atoms == [[[1]], [[2]]]
+
+
+@pytest.mark.parametrize("preset", ["QCHEM", "GAU_TIGHT", "CFOUR"])
+def test_all_criteria_from_user(preset):
+    user = {
+        "max_force_g_convergence": 1e-4,
+        "rms_force_g_convergence": 2e-4,
+        "max_energy_g_convergence": 3e-4,
+        "max_disp_g_convergence": 4e-4,
+        "rms_disp_g_convergence": 5e-4,
+    }
+    params = optking.optparams.OptParams({"g_convergence": preset, **user})
+
+    assert not params.i_untampered
+    assert [params.conv_max_force, params.conv_rms_force, params.conv_max_DE] == [1e-4, 2e-4, 3e-4]
+    assert [params.conv_max_disp, params.conv_rms_disp] == [4e-4, 5e-4]
+    assert all([params.i_max_force, params.i_rms_force, params.i_max_DE, params.i_max_disp, params.i_rms_disp])
+
+
+def test_internal_dict_round_trip():
+    params = optking.optparams.OptParams({"opt_type": "IRC", "intrafrag_hess": "LINDH"})
+    params.intrafrag_trust = 0.123
+    restored = optking.optparams.OptParams.from_internal_dict(params.to_dict())
+
+    assert restored.to_dict() == params.to_dict()
+    assert restored.read_cartesian_H and restored.h_guess_every
+
+
+def test_dynamic_level_params():
+    params = optking.optparams.OptParams({})
+    params.update_dynamic_level_params(4)
+    assert params.opt_coordinates == "CARTESIAN"
+    assert params.intrafrag_hess == "LINDH"
+    assert params.intrafrag_trust == params.intrafrag_trust_max == 0.2
+
+    params.update_dynamic_level_params(6)
+    assert params.step_type == "SD"
+    assert params.sd_hessian == 0.6
+
+    with pytest.raises(optking.exceptions.OptError):
+        params.update_dynamic_level_params(8)
+
+
+def test_setitem_enumerated_option():
+    params = optking.optparams.OptParams({})
+    params["step_type"] = "sd"
+    assert params.step_type == "SD"
+
+    with pytest.raises(optking.exceptions.OptError):
+        params["step_type"] = "not_a_step"
+
+
+def test_cached_construction_isolated():
+    first = optking.optparams.OptParams.get({"frozen_distance": "1 2"})
+    first.frozen_distance.append([3, 4])
+    first.frozen_distance[0][0] = 7
+    assert optking.optparams.OptParams.get({"frozen_distance": "1 2"}).frozen_distance == [[1, 2]]
+
+    class Specialized(optking.optparams.OptParams):
+        __slots__ = ()
+
+    assert type(Specialized.get({"geom_maxiter": 10})) is Specialized
+    assert type(optking.optparams.OptParams.get({"geom_maxiter": 10})) is optking.optparams.OptParams
@@ -0,0 +1,83 @@
+#! Test analytic torsion derivatives against finite differences, the batched B matrix rows, and equality.
+import numpy as np
+import pytest
+
+from optking.tors import Tors, TorsionBatch
+
+DISP_SIZE = 1.0e-4
+
+# H2O2-like skew chain plus two spectator atoms
+geom_hooh = np.array(
+    [
+        [0.90, 1.50, 0.80],
+        [0.00, 1.35, 0.00],
+        [0.00, -1.35, 0.00],
+        [-0.70, -1.60, 1.10],
+        [3.00, 0.00, 0.00],
+        [-3.00, 0.50, 0.20],
+    ]
+)
+
+
+@pytest.mark.parametrize("atoms", [(0, 1, 2, 3), (3, 2, 1, 0), (4, 1, 2, 5), (0, 2, 1, 5)])
+def test_tors_derivatives(atoms):
+    torsion = Tors(*atoms)
+    natom = len(geom_hooh)
+
+    B_analytic = np.zeros(3 * natom)
+    torsion.DqDx(geom_hooh.copy(), B_analytic)
+    H_analytic = np.zeros((3 * natom, 3 * natom))
+    torsion.Dq2Dx2(geom_hooh.copy(), H_analytic)
+
+    B_fd = np.zeros(3 * natom)
+    H_fd = np.zeros((3 * natom, 3 * natom))
+    for i in range(3 * natom):
+        plus = geom_hooh.copy()
+        plus.flat[i] += DISP_SIZE
+        minus = geom_hooh.copy()
+        minus.flat[i] -= DISP_SIZE
+        B_fd[i] = (torsion.q(plus) - torsion.q(minus)) / (2.0 * DISP_SIZE)
+
+        B_plus = np.zeros(3 * natom)
+        torsion.DqDx(plus, B_plus)
+        B_minus = np.zeros(3 * natom)
+        torsion.DqDx(minus, B_minus)
+        H_fd[i] = (B_plus - B_minus) / (2.0 * DISP_SIZE)
+
+    assert np.allclose(B_analytic, B_fd, atol=1.0e-7)
+    assert np.allclose(H_analytic, H_fd, atol=1.0e-6)
+    assert np.allclose(H_analytic, H_analytic.T)
+
+    B_mini = np.zeros(12)
+    torsion.DqDx(geom_hooh.copy(), B_mini, mini=True)
+    assert np.allclose(B_mini, B_analytic.reshape(natom, 3)[list(torsion.atoms)].ravel())
+
+
+def test_torsion_batch():
+    torsions = [Tors(0, 1, 2, 3), Tors(3, 2, 1, 0), Tors(4, 1, 2, 5), Tors(0, 2, 1, 5)]
+    geom = np.vstack([geom_hooh, [[0.00, 4.05, 0.00]]])
+    torsions.append(Tors(1, 2, 6, 4))  # 1-2-6 is linear
+
+    B_single = np.zeros((len(torsions), 3 * len(geom)))
+    for i, torsion in enumerate(torsions):
+        torsion.DqDx(geom, B_single[i])
+
+    B_batch = np.zeros((len(torsions) + 1, 3 * len(geom)))
+    rows = [4, 0, 1, 2, 5]
+    TorsionBatch(torsions).DqDx(geom, B_batch, rows)
+
+    assert np.allclose(B_batch[rows], B_single, atol=1.0e-12)
+    assert not B_batch[5].any() and not B_batch[3].any()
+
+
+def test_tors_eq_and_hash():
+    assert Tors(0, 1, 2, 3) == Tors(3, 2, 1, 0)
+    assert Tors(0, 1, 2, 3) != Tors(0, 1, 2, 4)
+    assert Tors(0, 1, 2, 70000) == Tors(70000, 2, 1, 0)
+    assert len({Tors(0, 1, 2, 3), Tors(3, 2, 1, 0), Tors(0, 2, 1, 3)}) == 2
+
+    torsion = Tors(4, 5, 6, 7)
+    torsion.atoms = (0, 1, 2, 3)
+    assert torsion == Tors(0, 1, 2, 3)
+    assert hash(torsion) == hash(Tors(0, 1, 2, 3))
+    assert torsion in {Tors(0, 1, 2, 3)}
@@ -0,0 +1,43 @@
+#! Test the scalar fast path of v3d.tors against the fully checked computation near its limits.
+import itertools
+from math import cos, pi, sin
+
+import numpy as np
+import pytest
+
+from optking import v3d
+from optking.exceptions import AlgError
+
+PHI_LIM = 0.017  # default v3d_tors_angle_lim
+TAU_LIM = (2.0e-10) ** 0.5  # |tau| where cos(tau) reaches 1 - v3d_tors_cos_tol
+
+bends = [1.9, PHI_LIM * (1 - 1e-9), PHI_LIM * (1 + 1e-9), pi - PHI_LIM * (1 - 1e-9), pi - PHI_LIM * (1 + 1e-9)]
+torsions = [1.0, -2.5, 0.0, pi, TAU_LIM * 0.99, -TAU_LIM * 1.01, pi - TAU_LIM * 0.99, -pi + TAU_LIM * 1.01]
+bond_lengths = [1.4, 1.0e-8 * (1 - 1e-6), 1.0e-8 * (1 + 1e-6)]
+
+
+def chain(phi_123, phi_234, tau, r_AB):
+    """A-B-C-D with bend angles phi_123, phi_234, dihedral tau and bond length r_AB"""
+    B = np.zeros(3)
+    C = np.array([0.0, 0.0, 1.5])
+    A = B + r_AB * np.array([sin(phi_123), 0.0, cos(phi_123)])
+    D = C + 1.1 * np.array([sin(phi_234) * cos(tau), sin(phi_234) * sin(tau), -cos(phi_234)])
+    return A, B, C, D
+
+
+@pytest.mark.parametrize("phi_123, tau, r_AB", list(itertools.product(bends, torsions, bond_lengths)))
+def test_tors_fast_path(phi_123, tau, r_AB):
+    points = chain(phi_123, 2.1, tau, r_AB)
+    fast = v3d._tors_fast(*points)
+
+    try:
+        checked = v3d._tors_checked(*points)
+    except AlgError:
+        assert fast is None
+        with pytest.raises(AlgError):
+            v3d.tors(*points)
+        return
+
+    if fast is not None:
+        assert fast == pytest.approx(checked, abs=1.0e-9)
+    assert v3d.tors(*points) == pytest.approx(checked, abs=1.0e-9)
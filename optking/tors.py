@@ -1,3 +1,4 @@
+import collections
 import logging
 import math
 
@@ -12,6 +13,161 @@ from .misc import hguess_lindh_rho, string_math_fx
 from .simple import Simple
 
 
+# ZETA[a, m, n] = Tors.zeta(a, m, n) for the four atoms a of a torsion
+_a, _m, _n = np.ogrid[:4, :4, :4]
+_ZETA = np.where(_a == _m, 1, np.where(_a == _n, -1, 0))
+del _a, _m, _n
+
+# Columns used by the B matrix
+_ZETA_01 = _ZETA[:, 0, 1]
+_ZETA_12 = _ZETA[:, 1, 2]
+_ZETA_21 = _ZETA[:, 2, 1]
+_ZETA_23 = _ZETA[:, 2, 3]
+
+
+def _zeta_outer(m, n, o, p):
+    """zeta(a, m, n) * zeta(b, o, p) over the atom pairs a, b of a torsion"""
+    return np.outer(_ZETA[:, m, n], _ZETA[:, o, p])
+
+
+# Atom factors [a, b] of the eight Dq2Dx2 terms in _tors_d2q_kernel, lower triangle only.
+_D2Q_ATOM_FACTORS = np.array(
+    [
+        np.tril(_zeta_outer(0, 1, 0, 1)),
+        np.tril(_zeta_outer(3, 2, 3, 2)),
+        np.tril(_zeta_outer(0, 1, 1, 2) + _zeta_outer(2, 1, 1, 0)),
+        np.tril(_zeta_outer(3, 2, 2, 1) + _zeta_outer(1, 2, 2, 3)),
+        np.tril(_zeta_outer(1, 2, 2, 1)),
+        np.tril(_zeta_outer(2, 1, 1, 2)),
+        # the off-diagonal cartesian terms only contribute for a != b
+        np.tril(_zeta_outer(3, 2, 2, 1), -1),
+        np.tril(_zeta_outer(2, 1, 1, 0), -1),
+    ],
+    dtype=float,
+)
+
+
+def _sym_outer(x, y):
+    """Symmetrized outer product, M[i, j] = x[i] * y[j] + x[j] * y[i]"""
+    return np.outer(x, y) + np.outer(y, x)
+
+
+# Off-diagonal cartesian terms of Dq2Dx2, (j - i) * (-0.5)^|j - i| * X[k], where k is the cartesian not i or j.
+# TODO are these powers correct ?  -0.5^( |j-i| w[k]cos(u)-u[k], e.g. ?
+_JMI = np.array([[0, 1, 2], [-1, 0, 1], [-2, -1, 0]])  # j - i
+_POW_NEG_HALF = np.array([[1.0, -0.5, 0.25], [-0.5, 1.0, -0.5], [0.25, -0.5, 1.0]])  # (-0.5)^|j - i|
+_SKEW = _JMI * _POW_NEG_HALF
+_K_LOOKUP = np.array([[0, 2, 1], [2, 1, 0], [1, 0, 2]])  # (3 - i - j) % 3
+
+
+_Frame = collections.namedtuple(
+    "_Frame", ["u", "v", "w", "Lu", "Lv", "Lw", "cos_u", "cos_v", "sin_u", "sin_v", "uXw", "vXw"]
+)
+
+
+def _tors_frame(geomA, geomB, geomC, geomD):
+    """Unit bond vectors, bond lengths and bend angle terms shared by the first and second
+    derivatives of the torsion A-B-C-D.  Returns None for a linear (0 or 180) angle.
+    """
+    # Scalar arithmetic on python floats is cheaper than numpy calls for 3-vectors
+    ux, uy, uz = (geomA - geomB).tolist()  # u=m-o eBA
+    vx, vy, vz = (geomD - geomC).tolist()  # v=n-p eCD
+    wx, wy, wz = (geomC - geomB).tolist()  # w=p-o eBC
+    Lu = math.sqrt(ux * ux + uy * uy + uz * uz)  # RBA
+    Lv = math.sqrt(vx * vx + vy * vy + vz * vz)  # RCD
+    Lw = math.sqrt(wx * wx + wy * wy + wz * wz)  # RBC
+    ux, uy, uz = ux * (1.0 / Lu), uy * (1.0 / Lu), uz * (1.0 / Lu)  # eBA
+    vx, vy, vz = vx * (1.0 / Lv), vy * (1.0 / Lv), vz * (1.0 / Lv)  # eCD
+    wx, wy, wz = wx * (1.0 / Lw), wy * (1.0 / Lw), wz * (1.0 / Lw)  # eBC
+
+    cos_u = ux * wx + uy * wy + uz * wz
+    cos_v = -(vx * wx + vy * wy + vz * wz)
+
+    # Abort and leave zero if 0 or 180 angle
+    if 1.0 - cos_u * cos_u <= 1.0e-12 or 1.0 - cos_v * cos_v <= 1.0e-12:
+        return None
+
+    sin_u = math.sqrt(1.0 - cos_u * cos_u)
+    sin_v = math.sqrt(1.0 - cos_v * cos_v)
+    uXw = np.array([uy * wz - uz * wy, uz * wx - ux * wz, ux * wy - uy * wx])
+    vXw = np.array([vy * wz - vz * wy, vz * wx - vx * wz, vx * wy - vy * wx])
+
+    u = np.array([ux, uy, uz])
+    v = np.array([vx, vy, vz])
+    w = np.array([wx, wy, wz])
+    return _Frame(u, v, w, Lu, Lv, Lw, cos_u, cos_v, sin_u, sin_v, uXw, vXw)
+
+
+def _dqdx_block(frame):
+    """First derivative block [a, i] of a torsion from its _tors_frame, where a is the relative atom
+    index and i the cartesian component.  For a frame whose entries are stacked over M torsions,
+    with the scalars as (M,) and the vectors as (M, 3) arrays, the blocks are returned as (M, 4, 3).
+    """
+    u, v, w, Lu, Lv, Lw, cos_u, cos_v, sin_u, sin_v, uXw, vXw = frame
+    uXw = uXw[..., np.newaxis, :]
+    vXw = vXw[..., np.newaxis, :]
+
+    def per_torsion(x):
+        return np.asarray(x)[..., np.newaxis, np.newaxis]
+
+    return (
+        _ZETA_01[:, np.newaxis] * uXw / per_torsion(Lu * sin_u * sin_u)
+        + _ZETA_23[:, np.newaxis] * vXw / per_torsion(Lv * sin_v * sin_v)
+        + _ZETA_12[:, np.newaxis] * uXw * per_torsion(cos_u) / per_torsion(Lw * sin_u * sin_u)
+        # "+" sign for zeta(a,2,1)) differs from JCP, 117, 9164 (2002)
+        - _ZETA_21[:, np.newaxis] * vXw * per_torsion(cos_v) / per_torsion(Lw * sin_v * sin_v)
+    )
+
+
+# There are several errors in JCP, 22, 9164, (2002).
+# I identified incorrect signs by making the equations invariant to reversing the atom indices
+# (0,1,2,3) -> (3,2,1,0) and checking terms against finite differences.  Also, the last terms
+# with sin^2 in the denominator are incorrectly given as only sin^1 in the paper.
+# Torsion is m-o-p-n.  -RAK 2010
+def _tors_d2q_kernel(frame):
+    """Second derivative blocks H[a, b, i, j] of a torsion from its _tors_frame, where a and b are the
+    relative atom indices and i and j the cartesian components.
+    """
+    u, v, w, Lu, Lv, Lw, cos_u, cos_v, sin_u, sin_v, uXw, vXw = frame
+
+    sinu4 = sin_u * sin_u * sin_u * sin_u
+    sinv4 = sin_v * sin_v * sin_v * sin_v
+    cosu3 = cos_u * cos_u * cos_u
+    cosv3 = cos_v * cos_v * cos_v
+
+    # Scalar denominators, inverted once and folded into a 3-vector before the outer products
+    inv_Lu2_sinu4 = 1.0 / (Lu * Lu * sinu4)
+    inv_Lv2_sinv4 = 1.0 / (Lv * Lv * sinv4)
+    inv_2LuLw_sinu4 = 0.5 / (Lu * Lw * sinu4)
+    inv_2LvLw_sinv4 = 0.5 / (Lv * Lw * sinv4)
+    inv_2Lw2_sinu4 = 0.5 / (Lw * Lw * sinu4)
+    inv_2Lw2_sinv4 = 0.5 / (Lw * Lw * sinv4)
+    inv_LuLw_sinu2 = 1.0 / (Lu * Lw * sin_u * sin_u)
+    inv_LvLw_sinv2 = 1.0 / (Lv * Lw * sin_v * sin_v)
+
+    # Each term is (4x4 factor over atoms a, b) x (3x3 factor over cartesians i, j).  The atom
+    # factors are the constant _D2Q_ATOM_FACTORS, which only cover b <= a; the remaining blocks
+    # follow from the symmetry of the second derivative.
+    xyz_factors = np.array(
+        [
+            _sym_outer(uXw * inv_Lu2_sinu4, w * cos_u - u),
+            # above under reversal of atom indices, u->v ; w->(-w) ; uXw->(-uXw)
+            _sym_outer(vXw * inv_Lv2_sinv4, w * cos_v + v),
+            _sym_outer(uXw * inv_2LuLw_sinu4, w - 2 * u * cos_u + w * cos_u * cos_u),
+            _sym_outer(vXw * inv_2LvLw_sinv4, w + 2 * v * cos_v + w * cos_v * cos_v),
+            _sym_outer(uXw * inv_2Lw2_sinu4, u + u * cos_u * cos_u - 3 * w * cos_u + w * cosu3),
+            _sym_outer(vXw * inv_2Lw2_sinv4, -v - v * cos_v * cos_v - 3 * w * cos_v + w * cosv3),
+            _SKEW * ((-w * cos_v - v) * inv_LvLw_sinv2)[_K_LOOKUP],
+            _SKEW * ((-w * cos_u + u) * inv_LuLw_sinu2)[_K_LOOKUP],
+        ]
+    )
+
+    H = np.einsum("tab,tij->abij", _D2Q_ATOM_FACTORS, xyz_factors)  # H[a, b, i, j]
+    H += H.transpose(1, 0, 3, 2)
+    H[range(4), range(4)] *= 0.5  # diagonal blocks were added to themselves
+    return H
+
+
 class Tors(Simple):
     """torsion coordinate between four atoms a-b-c-d
 
@@ -76,13 +232,20 @@ class Tors(Simple):
             s += "[{:.2f},{:.2f}]".format(self.range_min * self.q_show_factor, self.range_max * self.q_show_factor)
         return s
 
-    def __eq__(self, other):
-        if self.atoms != other.atoms:
-            return False
-        elif not isinstance(other, Tors):
-            return False
+    @Simple.atoms.setter
+    def atoms(self, values):
+        Simple.atoms.fset(self, values)
+        # Pack the atoms into one int for fast comparison; fall back to the tuple for huge indices
+        if len(values) == 4 and max(values) < 1 << 16:
+            self._key = int(values[0]) << 48 | int(values[1]) << 32 | int(values[2]) << 16 | int(values[3])
         else:
-            return True
+            self._key = tuple(int(atom) for atom in values)
+
+    def __eq__(self, other):
+        return isinstance(other, Tors) and self._key == other._key
+
+    def __hash__(self):
+        return hash(self._key)
 
     @property
     def near180(self):
@@ -91,12 +254,8 @@ class Tors(Simple):
     # keeps track of orientation
     def update_orientation(self, geom):
         tval = self.q(geom)
-        if tval > op.Params.fix_val_near_pi:
-            self._near180 = +1
-        elif tval < -1 * op.Params.fix_val_near_pi:
-            self._near180 = -1
-        else:
-            self._near180 = 0
+        fix_val_near_pi = op.Params.fix_val_near_pi
+        self._near180 = int(tval > fix_val_near_pi) - int(tval < -fix_val_near_pi)  # +1, -1 or 0
         return
 
     @property
@@ -163,211 +322,33 @@ class Tors(Simple):
 
         # Extend values domain of torsion angles beyond pi or -pi, so that
         # delta(values) can be calculated
+        shift = 0.0
         if self._near180 == -1 and tau > op.Params.fix_val_near_pi:
-            return tau - 2.0 * math.pi
+            shift = -2.0 * math.pi
         elif self._near180 == +1 and tau < -1 * op.Params.fix_val_near_pi:
-            return tau + 2.0 * math.pi
-        else:
-            return tau
+            shift = 2.0 * math.pi
+        return tau + shift
 
     def DqDx(self, geom, dqdx, mini=False):
-        u = geom[self.A] - geom[self.B]  # u=m-o eBA
-        v = geom[self.D] - geom[self.C]  # v=n-p eCD
-        w = geom[self.C] - geom[self.B]  # w=p-o eBC
-        Lu = v3d.norm(u)  # RBA
-        Lv = v3d.norm(v)  # RCD
-        Lw = v3d.norm(w)  # RBC
-        u *= 1.0 / Lu  # eBA
-        v *= 1.0 / Lv  # eCD
-        w *= 1.0 / Lw  # eBC
-
-        cos_u = v3d.dot(u, w)
-        cos_v = -v3d.dot(v, w)
-
-        # abort and leave zero if 0 or 180 angle
-        if 1.0 - cos_u * cos_u <= 1.0e-12 or 1.0 - cos_v * cos_v <= 1.0e-12:
+        frame = _tors_frame(geom[self.A], geom[self.B], geom[self.C], geom[self.D])
+        if frame is None:  # abort and leave zero if 0 or 180 angle
             return
+        block = _dqdx_block(frame)  # block[a, i]; a = relative index of atom, i = a_xyz
 
-        sin_u = math.sqrt(1.0 - cos_u * cos_u)
-        sin_v = math.sqrt(1.0 - cos_v * cos_v)
-        uXw = v3d.cross(u, w)
-        vXw = v3d.cross(v, w)
-
-        # a = relative index; B = full index of atom
-        for a, B in enumerate(self.atoms):
-            for i in range(3):  # i=a_xyz
-                tval = 0.0
-
-                if a == 0 or a == 1:
-                    tval += Tors.zeta(a, 0, 1) * uXw[i] / (Lu * sin_u * sin_u)
-
-                if a == 2 or a == 3:
-                    tval += Tors.zeta(a, 2, 3) * vXw[i] / (Lv * sin_v * sin_v)
-
-                if a == 1 or a == 2:
-                    tval += Tors.zeta(a, 1, 2) * uXw[i] * cos_u / (Lw * sin_u * sin_u)
-
-                # "+" sign for zeta(a,2,1)) differs from JCP, 117, 9164 (2002)
-                if a == 1 or a == 2:
-                    tval += -Tors.zeta(a, 2, 1) * vXw[i] * cos_v / (Lw * sin_v * sin_v)
-
-                if not mini:
-                    dqdx[3 * B + i] = tval
-                else:
-                    dqdx[3 * a + i] = tval
+        if not mini:
+            dqdx[(3 * np.asarray(self.atoms)[:, np.newaxis] + np.arange(3)).ravel()] = block.ravel()
+        else:
+            dqdx[:12] = block.ravel()
         return
 
-    # There are several errors in JCP, 22, 9164, (2002).
-    # I identified incorrect signs by making the equations invariant to reversing the atom indices
-    # (0,1,2,3) -> (3,2,1,0) and checking terms against finite differences.  Also, the last terms
-    # with sin^2 in the denominator are incorrectly given as only sin^1 in the paper.
-    # Torsion is m-o-p-n.  -RAK 2010
     def Dq2Dx2(self, geom, dq2dx2):
-        u = geom[self.A] - geom[self.B]  # u=m-o eBA
-        v = geom[self.D] - geom[self.C]  # v=n-p eCD
-        w = geom[self.C] - geom[self.B]  # w=p-o eBC
-        Lu = v3d.norm(u)  # RBA
-        Lv = v3d.norm(v)  # RCD
-        Lw = v3d.norm(w)  # RBC
-        u *= 1.0 / Lu  # eBA
-        v *= 1.0 / Lv  # eCD
-        w *= 1.0 / Lw  # eBC
-
-        cos_u = v3d.dot(u, w)
-        cos_v = -v3d.dot(v, w)
-
-        # Abort and leave zero if 0 or 180 angle
-        if 1.0 - cos_u * cos_u <= 1.0e-12 or 1.0 - cos_v * cos_v <= 1.0e-12:
+        frame = _tors_frame(geom[self.A], geom[self.B], geom[self.C], geom[self.D])
+        if frame is None:  # Abort and leave zero if 0 or 180 angle
             return
+        H = _tors_d2q_kernel(frame)
 
-        sin_u = math.sqrt(1.0 - cos_u * cos_u)
-        sin_v = math.sqrt(1.0 - cos_v * cos_v)
-        uXw = v3d.cross(u, w)
-        vXw = v3d.cross(v, w)
-
-        sinu4 = sin_u * sin_u * sin_u * sin_u
-        sinv4 = sin_v * sin_v * sin_v * sin_v
-        cosu3 = cos_u * cos_u * cos_u
-        cosv3 = cos_v * cos_v * cos_v
-
-        # int k; // cartesian ; not i or j
-        for a in range(4):
-            for b in range(a + 1):
-                for i in range(3):  # i = a_xyz
-                    for j in range(3):  # j=b_xyz
-                        tval = 0
-
-                        if (a == 0 and b == 0) or (a == 1 and b == 0) or (a == 1 and b == 1):
-                            tval += (
-                                Tors.zeta(a, 0, 1)
-                                * Tors.zeta(b, 0, 1)
-                                * (uXw[i] * (w[j] * cos_u - u[j]) + uXw[j] * (w[i] * cos_u - u[i]))
-                                / (Lu * Lu * sinu4)
-                            )
-
-                        # above under reversal of atom indices, u->v ; w->(-w) ; uXw->(-uXw)
-                        if (a == 3 and b == 3) or (a == 3 and b == 2) or (a == 2 and b == 2):
-                            tval += (
-                                Tors.zeta(a, 3, 2)
-                                * Tors.zeta(b, 3, 2)
-                                * (vXw[i] * (w[j] * cos_v + v[j]) + vXw[j] * (w[i] * cos_v + v[i]))
-                                / (Lv * Lv * sinv4)
-                            )
-
-                        if (a == 1 and b == 1) or (a == 2 and b == 1) or (a == 2 and b == 0) or (a == 1 and b == 0):
-                            tval += (
-                                (Tors.zeta(a, 0, 1) * Tors.zeta(b, 1, 2) + Tors.zeta(a, 2, 1) * Tors.zeta(b, 1, 0))
-                                * (
-                                    uXw[i] * (w[j] - 2 * u[j] * cos_u + w[j] * cos_u * cos_u)
-                                    + uXw[j] * (w[i] - 2 * u[i] * cos_u + w[i] * cos_u * cos_u)
-                                )
-                                / (2 * Lu * Lw * sinu4)
-                            )
-
-                        if (a == 3 and b == 2) or (a == 3 and b == 1) or (a == 2 and b == 2) or (a == 2 and b == 1):
-                            tval += (
-                                (Tors.zeta(a, 3, 2) * Tors.zeta(b, 2, 1) + Tors.zeta(a, 1, 2) * Tors.zeta(b, 2, 3))
-                                * (
-                                    vXw[i] * (w[j] + 2 * v[j] * cos_v + w[j] * cos_v * cos_v)
-                                    + vXw[j] * (w[i] + 2 * v[i] * cos_v + w[i] * cos_v * cos_v)
-                                )
-                                / (2 * Lv * Lw * sinv4)
-                            )
-
-                        if (a == 1 and b == 1) or (a == 2 and b == 2) or (a == 2 and b == 1):
-                            tval += (
-                                Tors.zeta(a, 1, 2)
-                                * Tors.zeta(b, 2, 1)
-                                * (
-                                    uXw[i] * (u[j] + u[j] * cos_u * cos_u - 3 * w[j] * cos_u + w[j] * cosu3)
-                                    + uXw[j] * (u[i] + u[i] * cos_u * cos_u - 3 * w[i] * cos_u + w[i] * cosu3)
-                                )
-                                / (2 * Lw * Lw * sinu4)
-                            )
-
-                        if (a == 2 and b == 1) or (a == 2 and b == 2) or (a == 1 and b == 1):
-                            tval += (
-                                Tors.zeta(a, 2, 1)
-                                * Tors.zeta(b, 1, 2)
-                                * (
-                                    vXw[i] * (-v[j] - v[j] * cos_v * cos_v - 3 * w[j] * cos_v + w[j] * cosv3)
-                                    + vXw[j] * (-v[i] - v[i] * cos_v * cos_v - 3 * w[i] * cos_v + w[i] * cosv3)
-                                )
-                                / (2 * Lw * Lw * sinv4)
-                            )
-
-                        if (a != b) and (i != j):
-                            if i != 0 and j != 0:
-                                k = 0  # k is unique coordinate not i or j
-                            elif i != 1 and j != 1:
-                                k = 1
-                            else:
-                                k = 2
-                            # TODO are these powers correct ?  -0.5^( |j-i| w[k]cos(u)-u[k], e.g. ?
-
-                            if a == 1 and b == 1:
-                                tval += (
-                                    Tors.zeta(a, 0, 1)
-                                    * Tors.zeta(b, 1, 2)
-                                    * (j - i)
-                                    * pow(-0.5, math.fabs(j - i))
-                                    * (+w[k] * cos_u - u[k])
-                                    / (Lu * Lw * sin_u * sin_u)
-                                )
-
-                            if (a == 3 and b == 2) or (a == 3 and b == 1) or (a == 2 and b == 2) or (a == 2 and b == 1):
-                                tval += (
-                                    Tors.zeta(a, 3, 2)
-                                    * Tors.zeta(b, 2, 1)
-                                    * (j - i)
-                                    * pow(-0.5, math.fabs(j - i))
-                                    * (-w[k] * cos_v - v[k])
-                                    / (Lv * Lw * sin_v * sin_v)
-                                )
-
-                            if (a == 2 and b == 1) or (a == 2 and b == 0) or (a == 1 and b == 1) or (a == 1 and b == 0):
-                                tval += (
-                                    Tors.zeta(a, 2, 1)
-                                    * Tors.zeta(b, 1, 0)
-                                    * (j - i)
-                                    * pow(-0.5, math.fabs(j - i))
-                                    * (-w[k] * cos_u + u[k])
-                                    / (Lu * Lw * sin_u * sin_u)
-                                )
-
-                            if a == 2 and b == 2:
-                                tval += (
-                                    Tors.zeta(a, 1, 2)
-                                    * Tors.zeta(b, 2, 3)
-                                    * (j - i)
-                                    * pow(-0.5, math.fabs(j - i))
-                                    * (+w[k] * cos_v + v[k])
-                                    / (Lv * Lw * sin_v * sin_v)
-                                )
-
-                        dq2dx2[3 * self.atoms[a] + i][3 * self.atoms[b] + j] = dq2dx2[3 * self.atoms[b] + j][
-                            3 * self.atoms[a] + i
-                        ] = tval
+        idx = (3 * np.asarray(self.atoms)[:, np.newaxis] + np.arange(3)).ravel()  # 3 * A + i
+        dq2dx2[np.ix_(idx, idx)] = H.transpose(0, 2, 1, 3).reshape(12, 12)
         return
 
     def diagonal_hessian_guess(self, geom, Z, connectivity, guess_type="SIMPLE"):
@@ -429,3 +410,36 @@ class Tors(Simple):
                 As default, identity matrix is used"""
             )
             return 1.0
+
+
+class TorsionBatch:
+    """Structure-of-arrays view of a list of torsions, so that the derivative blocks of all their
+    B-matrix rows are assembled and scattered in one vectorized pass instead of one Tors.DqDx call
+    apiece.  The frames and the block formula are the ones Tors.DqDx uses.
+
+    Parameters
+    ----------
+    torsions : list(Tors)
+    """
+
+    def __init__(self, torsions):
+        self.atoms = np.array([t.atoms for t in torsions], dtype=int).reshape(-1, 4)  # (M, 4)
+
+    def __len__(self):
+        return len(self.atoms)
+
+    def DqDx(self, geom, dqdx, rows=None):
+        """Write the first derivative of torsion m into row rows[m] of dqdx (default row m).  As in
+        Tors.DqDx, rows of torsions with a linear (0 or 180) angle are left untouched."""
+        rows = np.arange(len(self)) if rows is None else np.asarray(rows, dtype=int)
+        frames = [_tors_frame(geom[A], geom[B], geom[C], geom[D]) for A, B, C, D in self.atoms]
+
+        # skip torsions with a 0 or 180 angle
+        ok = np.array([frame is not None for frame in frames], dtype=bool)
+        if not ok.any():
+            return
+        stacked = _Frame(*(np.array(entry) for entry in zip(*(frame for frame in frames if frame is not None))))
+        block = _dqdx_block(stacked)  # block[m, a, i]; a = relative index of atom, i = a_xyz
+
+        cols = (3 * self.atoms[ok][:, :, np.newaxis] + np.arange(3)).reshape(-1, 12)
+        dqdx[rows[ok][:, np.newaxis], cols] = block.reshape(-1, 12)
@@ -15,6 +15,9 @@ from .exceptions import AlgError, OptError
 #  tors_cos_tol = op.Params.v3d_tors_cos_tol
 
 DOT_PARALLEL_LIMIT = 1.0e-10
+NORMALIZE_MIN = 1.0e-8  # shortest vector normalize() will accept
+NORMALIZE_MAX = 1.0e15  # longest vector normalize() will accept
+ANGLE_COS_TOL = 1.0e-14  # nearness of cos to 1/-1 to set an angle to 0/pi
 
 
 def norm(v):
@@ -46,7 +49,7 @@ def dist(v1, v2):
     # return sqrt((v2[0] - v1[0])**2 + (v2[1] - v1[1])**2 + (v2[2] - v1[2])**2)
 
 
-def normalize(v1, Rmin=1.0e-8, Rmax=1.0e15):
+def normalize(v1, Rmin=NORMALIZE_MIN, Rmax=NORMALIZE_MAX):
     """
     Normalize vector in place.  If norm exceeds thresholds, don't normalize and return False..
     """
@@ -111,7 +114,7 @@ def are_parallel_or_antiparallel(u, v):
     return are_parallel(u, v) or are_antiparallel(u, v)
 
 
-def angle(A, B, C, tol=1.0e-14):
+def angle(A, B, C, tol=ANGLE_COS_TOL):
     """Compute and return angle in radians A-B-C (between vector B->A and vector B->C)
     If points are absurdly close or far apart, returns False
 
@@ -143,7 +146,7 @@ def angle(A, B, C, tol=1.0e-14):
     return _calc_angle(eBA, eBC, tol)
 
 
-def _calc_angle(vec_1, vec_2, tol=1.0e-14):
+def _calc_angle(vec_1, vec_2, tol=ANGLE_COS_TOL):
     """
     Computes and returns angle in radians A-B_B (between vector B->A and vector B->C
 
@@ -188,6 +191,62 @@ def tors(A, B, C, D):
     -------
     float
 
+    """
+    tau = _tors_fast(A, B, C, D)
+    if tau is None:
+        tau = _tors_checked(A, B, C, D)
+    return tau
+
+
+def _tors_fast(A, B, C, D):
+    """
+    tors() for a well-defined torsion, in scalar arithmetic on python floats, which for
+    3-vectors is much cheaper than the numpy helpers.  Returns None instead whenever a bond
+    length, bend angle or cos(tau) comes near one of the limits checked by _tors_checked().
+    """
+    phi_lim = op.Params.v3d_tors_angle_lim
+    tors_cos_tol = op.Params.v3d_tors_cos_tol
+
+    ax, ay, az = (A - B).tolist()  # B->A
+    bx, by, bz = (C - B).tolist()  # B->C
+    cx, cy, cz = (D - C).tolist()  # C->D
+    La = sqrt(ax * ax + ay * ay + az * az)
+    Lb = sqrt(bx * bx + by * by + bz * bz)
+    Lc = sqrt(cx * cx + cy * cy + cz * cz)
+    if not (NORMALIZE_MIN <= min(La, Lb, Lc) and max(La, Lb, Lc) <= NORMALIZE_MAX):
+        return None
+    ax, ay, az = ax / La, ay / La, az / La  # EBA
+    bx, by, bz = bx / Lb, by / Lb, bz / Lb  # EBC
+    cx, cy, cz = cx / Lc, cy / Lc, cz / Lc  # ECD
+
+    # Compute bond angles
+    cos_123 = ax * bx + ay * by + az * bz
+    cos_234 = -(bx * cx + by * cy + bz * cz)
+    if not (fabs(cos_123) < 1.0 - ANGLE_COS_TOL and fabs(cos_234) < 1.0 - ANGLE_COS_TOL):
+        return None
+    phi_123 = acos(cos_123)
+    phi_234 = acos(cos_234)
+    up_lim = acos(-1) - phi_lim
+    if not (phi_lim <= phi_123 <= up_lim and phi_lim <= phi_234 <= up_lim):
+        return None
+
+    # (EAB x EBC) . (EBC x ECD), with EAB = -EBA
+    t1x, t1y, t1z = by * az - bz * ay, bz * ax - bx * az, bx * ay - by * ax
+    t2x, t2y, t2z = by * cz - bz * cy, bz * cx - bx * cz, bx * cy - by * cx
+    tval = (t1x * t2x + t1y * t2y + t1z * t2z) / (sin(phi_123) * sin(phi_234))
+    if fabs(tval) >= 1.0 - tors_cos_tol:
+        return None
+
+    # determine sign of torsion ; this convention matches Wilson, Decius and Cross
+    tau = acos(tval)
+    if -(ax * t2x + ay * t2y + az * t2z) < 0:
+        tau *= -1
+    return tau
+
+
+def _tors_checked(A, B, C, D):
+    """
+    tors() with every numerical check, raising AlgError for a torsion that is not well-defined.
     """
     logger = logging.getLogger(__name__)
     phi_lim = op.Params.v3d_tors_angle_lim